@@ -0,0 +1,53 @@
+"""move timestamp defaults server-side and store them as timestamptz
+
+Revision ID: 0003_server_side_timestamps
+Revises: 0002_add_company_to_users
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0003_server_side_timestamps"
+down_revision = "0002_add_company_to_users"
+branch_labels = None
+depends_on = None
+
+# table → (columns defaulting to now(), other timestamp columns)
+_TIMESTAMP_COLUMNS = {
+    "campaigns":             (("created_at", "updated_at"), ("approved_at",)),
+    "contacts":              (("created_at", "updated_at"), ()),
+    "icp_results":           (("created_at",), ()),
+    "pipeline_runs":         (("started_at",), ("completed_at",)),
+    "campaign_logs":         (("started_at",), ("completed_at",)),
+    "outbound_messages":     (("created_at",), ("sent_at",)),
+    "email_tracking_events": (("created_at",), ()),
+    "engagement_history":    (("occurred_at",), ()),
+    "conversion_events":     (("occurred_at",), ()),
+    "users":                 (("created_at", "updated_at"), ()),
+    "voice_calls":           (("created_at", "updated_at"), ()),
+}
+
+
+def upgrade() -> None:
+    for table, (defaulted, plain) in _TIMESTAMP_COLUMNS.items():
+        for column in defaulted + plain:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(timezone=True),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+        for column in defaulted:
+            op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    for table, (defaulted, plain) in _TIMESTAMP_COLUMNS.items():
+        for column in defaulted + plain:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
@@ -0,0 +1,45 @@
+"""composite (campaign_id, …) indexes on tracking tables
+
+Revision ID: 0004_tracking_composite_indexes
+Revises: 0003_server_side_timestamps
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0004_tracking_composite_indexes"
+down_revision = "0003_server_side_timestamps"
+branch_labels = None
+depends_on = None
+
+_COMPOSITE_INDEXES = [
+    ("ix_outbound_messages_campaign_channel",    "outbound_messages",     ["campaign_id", "channel"]),
+    ("ix_outbound_messages_campaign_contact",    "outbound_messages",     ["campaign_id", "contact_email"]),
+    ("ix_email_tracking_events_campaign_event",  "email_tracking_events", ["campaign_id", "event_type"]),
+    ("ix_engagement_history_campaign_event",     "engagement_history",    ["campaign_id", "event_type"]),
+    ("ix_engagement_history_campaign_time",      "engagement_history",    ["campaign_id", "occurred_at"]),
+    ("ix_engagement_history_campaign_contact",   "engagement_history",    ["campaign_id", "contact_email"]),
+    ("ix_conversion_events_campaign_contact",    "conversion_events",     ["campaign_id", "contact_email"]),
+]
+
+# Single-column indexes now covered by the leading column of a composite.
+_REDUNDANT_INDEXES = [
+    ("ix_outbound_messages_campaign_id",     "outbound_messages"),
+    ("ix_email_tracking_events_campaign_id", "email_tracking_events"),
+    ("ix_engagement_history_campaign_id",    "engagement_history"),
+    ("ix_conversion_events_campaign_id",     "conversion_events"),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in _COMPOSITE_INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+    for name, table in _REDUNDANT_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    for name, table in _REDUNDANT_INDEXES:
+        op.create_index(name, table, ["campaign_id"], if_not_exists=True)
+    for name, table, _ in _COMPOSITE_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
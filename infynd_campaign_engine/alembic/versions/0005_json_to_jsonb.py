@@ -0,0 +1,58 @@
+"""store JSON columns as jsonb
+
+Revision ID: 0005_json_to_jsonb
+Revises: 0004_tracking_composite_indexes
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0005_json_to_jsonb"
+down_revision = "0004_tracking_composite_indexes"
+branch_labels = None
+depends_on = None
+
+_JSON_COLUMNS = [
+    ("campaigns",             "generated_content"),
+    ("pipeline_runs",         "classification_summary"),
+    ("pipeline_runs",         "downstream_results"),
+    ("campaign_logs",         "metadata"),
+    ("email_tracking_events", "raw_payload"),
+    ("engagement_history",    "payload"),
+    ("conversion_events",     "metadata"),
+    ("voice_calls",           "conversation_log"),
+]
+
+
+def upgrade() -> None:
+    for table, column in _JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f"{column}::jsonb",
+        )
+    op.create_index(
+        "ix_email_tracking_events_raw_payload",
+        "email_tracking_events",
+        ["raw_payload"],
+        postgresql_using="gin",
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_email_tracking_events_raw_payload",
+        table_name="email_tracking_events",
+        if_exists=True,
+    )
+    for table, column in _JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            postgresql_using=f"{column}::json",
+        )
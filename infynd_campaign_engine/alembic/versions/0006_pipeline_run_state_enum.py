@@ -0,0 +1,46 @@
+"""store pipeline_runs.state as pipeline_state_enum
+
+Revision ID: 0006_pipeline_run_state_enum
+Revises: 0005_json_to_jsonb
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0006_pipeline_run_state_enum"
+down_revision = "0005_json_to_jsonb"
+branch_labels = None
+depends_on = None
+
+_PIPELINE_STATES = (
+    "CREATED", "CLASSIFIED", "CONTACTS_RETRIEVED", "CHANNEL_DECIDED",
+    "CONTENT_GENERATED", "AWAITING_APPROVAL", "APPROVED", "DISPATCHED",
+    "COMPLETED", "FAILED",
+)
+
+
+def upgrade() -> None:
+    pipeline_state_enum = postgresql.ENUM(*_PIPELINE_STATES, name="pipeline_state_enum")
+    pipeline_state_enum.create(op.get_bind(), checkfirst=True)
+
+    op.alter_column("pipeline_runs", "state", server_default=None)
+    op.alter_column(
+        "pipeline_runs",
+        "state",
+        type_=pipeline_state_enum,
+        postgresql_using="state::pipeline_state_enum",
+    )
+    op.alter_column("pipeline_runs", "state", server_default=sa.text("'CREATED'"))
+
+
+def downgrade() -> None:
+    op.alter_column("pipeline_runs", "state", server_default=None)
+    op.alter_column(
+        "pipeline_runs",
+        "state",
+        type_=sa.String(50),
+        postgresql_using="state::text",
+    )
+    op.alter_column("pipeline_runs", "state", server_default=sa.text("'CREATED'"))
@@ -0,0 +1,41 @@
+"""generate primary-key UUIDs server-side with gen_random_uuid()
+
+Revision ID: 0007_server_side_uuid_pks
+Revises: 0006_pipeline_run_state_enum
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0007_server_side_uuid_pks"
+down_revision = "0006_pipeline_run_state_enum"
+branch_labels = None
+depends_on = None
+
+_TABLES = (
+    "campaigns",
+    "contacts",
+    "icp_results",
+    "pipeline_runs",
+    "campaign_logs",
+    "outbound_messages",
+    "email_tracking_events",
+    "engagement_history",
+    "conversion_events",
+    "users",
+    "voice_calls",
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    for table in _TABLES:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
+
+
+def downgrade() -> None:
+    # users has carried this default since 0001_create_users.
+    for table in _TABLES:
+        if table != "users":
+            op.alter_column(table, "id", server_default=None)
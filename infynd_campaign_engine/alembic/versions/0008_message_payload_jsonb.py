@@ -0,0 +1,46 @@
+"""store outbound_messages.message_payload as jsonb
+
+Revision ID: 0008_message_payload_jsonb
+Revises: 0007_server_side_uuid_pks
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0008_message_payload_jsonb"
+down_revision = "0007_server_side_uuid_pks"
+branch_labels = None
+depends_on = None
+
+# Older rows were written with str(dict) rather than json.dumps, so they are
+# not valid JSON; keep those as a JSON string instead of failing the cast.
+_TRY_JSONB = """
+CREATE FUNCTION pg_temp.try_jsonb(value text) RETURNS jsonb AS $$
+BEGIN
+    RETURN value::jsonb;
+EXCEPTION WHEN others THEN
+    RETURN to_jsonb(value);
+END;
+$$ LANGUAGE plpgsql IMMUTABLE
+"""
+
+
+def upgrade() -> None:
+    op.execute(_TRY_JSONB)
+    op.alter_column(
+        "outbound_messages",
+        "message_payload",
+        type_=postgresql.JSONB(),
+        postgresql_using="pg_temp.try_jsonb(message_payload)",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "outbound_messages",
+        "message_payload",
+        type_=sa.Text(),
+        postgresql_using="message_payload::text",
+    )
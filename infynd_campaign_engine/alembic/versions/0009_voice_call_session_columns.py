@@ -0,0 +1,36 @@
+"""add the voice_calls session and reliability columns
+
+Revision ID: 0009_voice_call_session_columns
+Revises: 0008_message_payload_jsonb
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0009_voice_call_session_columns"
+down_revision = "0008_message_payload_jsonb"
+branch_labels = None
+depends_on = None
+
+# Declared on VoiceCall but never created by migrate.sql; IF NOT EXISTS keeps
+# this safe on databases where they were added by hand.
+_COLUMNS = [
+    ("conversation_state", "JSONB"),
+    ("turn_count",         "INTEGER DEFAULT 0"),
+    ("language_code",      "VARCHAR(10) DEFAULT 'en-US'"),
+    ("email_captured",     "VARCHAR(255)"),
+    ("email_sent",         "INTEGER DEFAULT 0"),
+    ("retry_count",        "INTEGER DEFAULT 0"),
+    ("duration_seconds",   "INTEGER DEFAULT 0"),
+    ("quality_score",      "INTEGER"),
+]
+
+
+def upgrade() -> None:
+    for column, ddl in _COLUMNS:
+        op.execute(f"ALTER TABLE voice_calls ADD COLUMN IF NOT EXISTS {column} {ddl}")
+
+
+def downgrade() -> None:
+    for column, _ in reversed(_COLUMNS):
+        op.execute(f"ALTER TABLE voice_calls DROP COLUMN IF EXISTS {column}")
@@ -9,7 +9,7 @@ Saves mapping in pipeline_runs.downstream_results.
 Updates state to CHANNEL_DECIDED.
 """
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any, List
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -59,7 +59,7 @@ async def run_channel_decision_agent(
     campaign: Campaign,
     pipeline_run: PipelineRun,
 ) -> Dict[str, str]:
-    started_at = datetime.utcnow()
+    started_at = datetime.now(timezone.utc)
     log = CampaignLog(
         campaign_id=campaign.id,
         agent_name="ChannelDecisionAgent",
@@ -94,7 +94,7 @@ async def run_channel_decision_agent(
             .values(pipeline_state=PipelineState.CHANNEL_DECIDED)
         )
 
-        completed_at = datetime.utcnow()
+        completed_at = datetime.now(timezone.utc)
         duration_ms = int((completed_at - started_at).total_seconds() * 1000)
         await db.execute(
             update(CampaignLog)
@@ -107,7 +107,7 @@ async def run_channel_decision_agent(
         return channel_map
 
     except Exception as exc:
-        completed_at = datetime.utcnow()
+        completed_at = datetime.now(timezone.utc)
         duration_ms = int((completed_at - started_at).total_seconds() * 1000)
         await db.execute(
             update(CampaignLog)
@@ -9,7 +9,7 @@ Updates pipeline state to CLASSIFIED.
 import json
 import logging
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any
 
 import httpx
@@ -137,7 +137,7 @@ async def run_classification_agent(
     campaign: Campaign,
     pipeline_run: PipelineRun,
 ) -> Dict[str, Any]:
-    started_at = datetime.utcnow()
+    started_at = datetime.now(timezone.utc)
     log = CampaignLog(
         campaign_id=campaign.id,
         agent_name="ClassificationAgent",
@@ -185,7 +185,7 @@ async def run_classification_agent(
             .values(pipeline_state=PipelineState.CLASSIFIED)
         )
 
-        completed_at = datetime.utcnow()
+        completed_at = datetime.now(timezone.utc)
         duration_ms = int((completed_at - started_at).total_seconds() * 1000)
 
         await db.execute(
@@ -218,7 +218,7 @@ async def run_classification_agent(
                 .where(Campaign.id == campaign.id)
                 .values(pipeline_state=PipelineState.CLASSIFIED)
             )
-            completed_at = datetime.utcnow()
+            completed_at = datetime.now(timezone.utc)
             duration_ms = int((completed_at - started_at).total_seconds() * 1000)
             await db.execute(
                 update(CampaignLog)
@@ -6,7 +6,7 @@ Orders by buying_probability_score DESC NULLS LAST.
 Updates pipeline state to CONTACTS_RETRIEVED.
 """
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any, List
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -107,7 +107,7 @@ async def run_contact_retrieval_agent(
     campaign: Campaign,
     pipeline_run: PipelineRun,
 ) -> List[Dict[str, Any]]:
-    started_at = datetime.utcnow()
+    started_at = datetime.now(timezone.utc)
     log = CampaignLog(
         campaign_id=campaign.id,
         agent_name="ContactRetrievalAgent",
@@ -195,7 +195,7 @@ async def run_contact_retrieval_agent(
             .values(pipeline_state=PipelineState.CONTACTS_RETRIEVED)
         )
 
-        completed_at = datetime.utcnow()
+        completed_at = datetime.now(timezone.utc)
         duration_ms = int((completed_at - started_at).total_seconds() * 1000)
         await db.execute(
             update(CampaignLog)
@@ -208,7 +208,7 @@ async def run_contact_retrieval_agent(
         return serializable_contacts
 
     except Exception as exc:
-        completed_at = datetime.utcnow()
+        completed_at = datetime.now(timezone.utc)
         duration_ms = int((completed_at - started_at).total_seconds() * 1000)
         await db.execute(
             update(CampaignLog)
@@ -5,10 +5,11 @@ Stores in campaigns.generated_content (jsonb).
 Updates state to CONTENT_GENERATED.
 """
 
+import asyncio
 import json
 import logging
-from datetime import datetime
-from typing import Dict, Any, List
+from datetime import datetime, timezone
+from typing import Dict, Any, Awaitable, List, Optional
 
 import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -184,6 +185,31 @@ async def _call_ollama(prompt: str) -> Dict[str, Any]:
     return json.loads(raw)
 
 
+async def generate_common_templates(
+    campaign_purpose: str,
+    product_link: str,
+    prompt: str,
+) -> Dict[str, Any]:
+    """
+    Generate ONE common template per channel (all 3 channels, concurrently).
+    Depends only on the parsed campaign fields — not on contacts or the
+    channel map — so the pipeline can start it before Agents 1–3 finish.
+    Templates use [CONTACT_NAME], [CONTACT_COMPANY] etc. as placeholders;
+    real values are substituted at dispatch time per contact.
+    """
+    channels = list(PROMPT_MAP)
+    prompts = [
+        PROMPT_MAP[channel]
+        .replace("{{campaign_purpose}}", campaign_purpose)
+        .replace("{{product_link}}", product_link)
+        .replace("{{prompt}}", prompt)
+        for channel in channels
+    ]
+    logger.info(f"[ContentGeneratorAgent] Generating common templates for channels: {channels}")
+    results = await asyncio.gather(*(_call_ollama(p) for p in prompts))
+    return dict(zip(channels, results))
+
+
 # ─────────────────────────────────────────────────────────────
 # MAIN AGENT EXECUTION
 # ─────────────────────────────────────────────────────────────
@@ -192,9 +218,14 @@ async def run_content_generator_agent(
     db: AsyncSession,
     campaign: Campaign,
     pipeline_run: PipelineRun,
+    templates: Optional[Awaitable[Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
+    """
+    *templates* may be an already-running generate_common_templates task
+    started by the pipeline; otherwise the templates are generated here.
+    """
 
-    started_at = datetime.utcnow()
+    started_at = datetime.now(timezone.utc)
 
     log = CampaignLog(
         campaign_id=campaign.id,
@@ -210,31 +241,17 @@ async def run_content_generator_agent(
         contacts: List[Dict[str, Any]] = downstream.get("contacts", [])
         channel_map: Dict[str, str] = downstream.get("channel_map", {})
 
-        # ── Always generate all 3 channel templates ─────────────────────
-        # Even if no contacts are currently assigned to a channel, the user
-        # should see all templates and can reassign contacts during approval.
-        channels_needed: set = {"Email", "LinkedIn", "Call"}
-
-        # ── Step 1: Generate ONE common template per channel ─────────────
-        # Templates use [CONTACT_NAME], [CONTACT_COMPANY] etc. as placeholders.
-        # Real values are substituted at dispatch time per contact.
-        common_templates: Dict[str, Any] = {}
-
-        for channel in channels_needed:
-            base_prompt = PROMPT_MAP.get(channel)
-            if not base_prompt:
-                logger.warning(f"[ContentGeneratorAgent] No prompt for channel: {channel}")
-                continue
-
-            prompt = (
-                base_prompt
-                .replace("{{campaign_purpose}}", campaign.campaign_purpose or "")
-                .replace("{{product_link}}", campaign.product_link or "")
-                .replace("{{prompt}}", campaign.prompt or "")
+        # ── Step 1: ONE common template per channel ──────────────────────
+        # All 3 channels are always generated: even if no contacts are
+        # currently assigned to a channel, the user should see all templates
+        # and can reassign contacts during approval.
+        if templates is None:
+            templates = generate_common_templates(
+                campaign.campaign_purpose or "",
+                campaign.product_link or "",
+                campaign.prompt or "",
             )
-
-            logger.info(f"[ContentGeneratorAgent] Generating common template for channel: {channel}")
-            common_templates[channel] = await _call_ollama(prompt)
+        common_templates: Dict[str, Any] = await templates
 
         # ── Step 2: Build contacts map (email → channel) ─────────────────
         contacts_map: Dict[str, str] = {
@@ -264,7 +281,7 @@ async def run_content_generator_agent(
             .values(state=PipelineState.CONTENT_GENERATED)
         )
 
-        completed_at = datetime.utcnow()
+        completed_at = datetime.now(timezone.utc)
         duration_ms = int((completed_at - started_at).total_seconds() * 1000)
 
         await db.execute(
@@ -288,7 +305,7 @@ async def run_content_generator_agent(
 
     except Exception as exc:
 
-        completed_at = datetime.utcnow()
+        completed_at = datetime.now(timezone.utc)
         duration_ms = int((completed_at - started_at).total_seconds() * 1000)
 
         await db.execute(
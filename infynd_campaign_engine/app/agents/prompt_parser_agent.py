@@ -6,7 +6,7 @@ This runs as the FIRST step in the pipeline so all downstream agents have rich c
 """
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
 import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -68,7 +68,7 @@ async def run_prompt_parser_agent(
         logger.info(f"[PromptParser] No prompt supplied for campaign {campaign.id} — skipping")
         return
 
-    started_at = datetime.utcnow()
+    started_at = datetime.now(timezone.utc)
     log = CampaignLog(
         campaign_id=campaign.id,
         agent_name="PromptParserAgent",
@@ -121,7 +121,7 @@ async def run_prompt_parser_agent(
             await db.commit()
             logger.info(f"[PromptParser] Campaign {campaign.id} enriched: {list(updates.keys())}")
 
-        completed_at = datetime.utcnow()
+        completed_at = datetime.now(timezone.utc)
         log.status = "SUCCESS"
         log.completed_at = completed_at
         log.duration_ms = int((completed_at - started_at).total_seconds() * 1000)
@@ -131,7 +131,7 @@ async def run_prompt_parser_agent(
     except Exception as exc:
         logger.error(f"[PromptParser] Failed for campaign {campaign.id}: {exc}", exc_info=True)
         # Non-fatal — mark log but let pipeline continue
-        completed_at = datetime.utcnow()
+        completed_at = datetime.now(timezone.utc)
         log.status = "FAILED"
         log.error_message = str(exc)
         log.completed_at = completed_at
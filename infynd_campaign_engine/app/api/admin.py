@@ -8,6 +8,7 @@ from app.core.database import get_db
 from app.core.dependencies import require_roles, TokenData
 from app.core.security import hash_password
 from app.models.user import User
+from app.services.tts_service import refresh_voices
 from app.schemas.admin import (
     AdminCreateUserRequest,
     AdminUpdateUserRequest,
@@ -140,3 +141,14 @@ async def delete_user(
 
     await db.delete(user)
     logger.info(f"[Admin] Deleted user {user.email} by {current_user.email}")
+
+
+# ── REFRESH TTS VOICES ────────────────────────────────────────────────────────
+@router.post("/tts/voices/refresh")
+async def refresh_tts_voices(
+    current_user: TokenData = Depends(_admin),
+):
+    """Re-enumerate installed TTS voices after an OS voice change. ADMIN only."""
+    voices = await refresh_voices()
+    logger.info(f"[Admin] TTS voice list refreshed by {current_user.email} ({len(voices)} voices)")
+    return {"voices": voices}
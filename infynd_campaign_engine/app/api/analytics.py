@@ -29,7 +29,11 @@ async def get_campaign_analytics(
     db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(require_roles(["ADMIN", "MANAGER", "ANALYST"])),
 ):
-    """Return comprehensive real-time analytics for a campaign."""
+    """Return comprehensive real-time analytics for a campaign.
+
+    Every value below comes straight out of SQL aggregates, so the response
+    DTOs are built with ``model_construct`` rather than re-validated.
+    """
 
     campaign_result = await db.execute(
         select(Campaign).where(Campaign.id == campaign_id)
@@ -124,7 +128,7 @@ async def get_campaign_analytics(
         if row["channel"] == "Call":
             calls_sent = sent
 
-        breakdown.append(ChannelBreakdown(
+        breakdown.append(ChannelBreakdown.model_construct(
             channel=row["channel"],
             sent=sent,
             delivered=delivered,
@@ -163,18 +167,18 @@ async def get_campaign_analytics(
     hourly_result = await db.execute(
         text("""
             SELECT
-                TO_CHAR(DATE_TRUNC('hour', occurred_at), 'YYYY-MM-DD"T"HH24:00:00') AS hour,
+                TO_CHAR(DATE_TRUNC('hour', occurred_at AT TIME ZONE 'UTC'), 'YYYY-MM-DD"T"HH24:00:00') AS hour,
                 COUNT(*) AS cnt
             FROM engagement_history
             WHERE campaign_id = :cid
               AND event_type != 'SENT'
-            GROUP BY DATE_TRUNC('hour', occurred_at)
-            ORDER BY DATE_TRUNC('hour', occurred_at) ASC
+            GROUP BY DATE_TRUNC('hour', occurred_at AT TIME ZONE 'UTC')
+            ORDER BY DATE_TRUNC('hour', occurred_at AT TIME ZONE 'UTC') ASC
         """),
         {"cid": str(campaign_id)},
     )
     hourly_activity = [
-        HourlyActivity(hour=r["hour"], count=int(r["cnt"]))
+        HourlyActivity.model_construct(hour=r["hour"], count=int(r["cnt"]))
         for r in hourly_result.mappings().all()
     ]
 
@@ -202,7 +206,7 @@ async def get_campaign_analytics(
             """),
             {"cid": str(campaign_id), "email": r["contact_email"]},
         )
-        top_contacts.append(TopContact(
+        top_contacts.append(TopContact.model_construct(
             email=r["contact_email"],
             events=int(r["events"]),
             latest_event_type=latest_result.scalar_one_or_none(),
@@ -220,7 +224,7 @@ async def get_campaign_analytics(
     reach_rate          = pct(total_delivered, total_contacts)
     click_to_open_rate  = pct(total_clicked,   total_opened)
 
-    return CampaignAnalytics(
+    return CampaignAnalytics.model_construct(
         campaign_id=campaign_id,
         total_contacts=total_contacts,
         sent=total_sent,
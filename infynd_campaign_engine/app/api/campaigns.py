@@ -1,8 +1,9 @@
+import asyncio
 import logging
 import uuid
 from typing import List
 from io import BytesIO
-from datetime import datetime
+from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, status
 from fastapi.responses import StreamingResponse
@@ -21,9 +22,9 @@ from app.schemas.campaign import (
     ErrorResponse, LogEntry, MessageEntry,
 )
 from app.services.pipeline_runner import execute_pipeline
-from app.services.dispatch_service import dispatch_campaign
 from app.services.sendgrid_service import send_email
-from app.services.tts_service import list_voices, synthesize_wav
+from app.services.tts_service import AUDIO_FORMATS, list_voices, synthesize_audio
+from app.worker.ai_tasks import run_dispatch
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/campaigns", tags=["Campaigns"])
@@ -56,12 +57,6 @@ def _campaign_response(campaign: Campaign) -> dict:
     }
 
 
-async def _dispatch_background(campaign_id: str):
-    """Launch dispatch in its own DB session so it survives after request close."""
-    async with AsyncSessionLocal() as db:
-        await dispatch_campaign(db, campaign_id)
-
-
 @router.post("/", response_model=CampaignResponse, status_code=status.HTTP_201_CREATED)
 async def create_campaign(
     payload: CampaignCreate,
@@ -178,7 +173,7 @@ async def get_campaign_messages(
             latest_event = eh.event_type
             event_payload = eh.payload if isinstance(eh.payload, dict) else None
 
-        enriched.append(MessageEntry(
+        enriched.append(MessageEntry.model_construct(
             id=msg.id,
             contact_email=msg.contact_email,
             channel=msg.channel,
@@ -273,10 +268,11 @@ async def get_common_content_audio(
     channel: str,
     rate: int = Query(default=168, ge=100, le=300),
     voice_id: str | None = Query(default=None),
+    audio_format: str = Query(default="wav", alias="format", pattern="^(wav|opus|mp3)$"),
     db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(get_current_user),
 ):
-    """Generate and stream audio for the common call-channel template."""
+    """Generate and stream audio for the common call-channel template (WAV, Opus or MP3)."""
     if channel.lower() != "call":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -320,7 +316,7 @@ async def get_common_content_audio(
         )
 
     try:
-        audio_bytes = await synthesize_wav(text, rate=rate, voice_id=voice_id)
+        audio_bytes, audio_format = await synthesize_audio(text, rate=rate, voice_id=voice_id, fmt=audio_format)
     except Exception as exc:
         logger.exception("[API] Failed to generate call template audio", exc_info=exc)
         raise HTTPException(
@@ -328,10 +324,11 @@ async def get_common_content_audio(
             detail={"detail": "Failed to generate audio for call template", "code": "AUDIO_GENERATION_FAILED"},
         )
 
-    filename = f"campaign_{campaign_id}_call_template.wav"
+    extension = "ogg" if audio_format == "opus" else audio_format
+    filename = f"campaign_{campaign_id}_call_template.{extension}"
     return StreamingResponse(
         BytesIO(audio_bytes),
-        media_type="audio/wav",
+        media_type=AUDIO_FORMATS[audio_format][0],
         headers={"Content-Disposition": f"inline; filename={filename}"},
     )
 
@@ -371,7 +368,6 @@ async def get_common_content_audio_voices(
 @router.post("/{campaign_id}/approve")
 async def approve_campaign(
     campaign_id: uuid.UUID,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(require_roles(["ADMIN", "MANAGER"])),
 ):
@@ -389,11 +385,30 @@ async def approve_campaign(
             pipeline_state=PipelineState.APPROVED,
             approval_status="APPROVED",
             approved_by=current_user.email,
-            approved_at=datetime.utcnow(),
+            approved_at=datetime.now(timezone.utc),
         )
     )
     await db.commit()
-    background_tasks.add_task(_dispatch_background, str(campaign_id))
+    try:
+        # Broker publish is blocking I/O — keep it off the event loop
+        await asyncio.to_thread(run_dispatch.delay, str(campaign_id))
+    except Exception as exc:
+        logger.error(f"[API] Could not queue dispatch for campaign {campaign_id}: {exc}", exc_info=True)
+        # No task will pick up APPROVED — put the campaign back so it can be re-approved
+        await db.execute(
+            update(Campaign)
+            .where(Campaign.id == campaign_id, Campaign.pipeline_state == PipelineState.APPROVED)
+            .values(
+                pipeline_state=PipelineState.AWAITING_APPROVAL,
+                approval_status="PENDING",
+                approved_by=None,
+                approved_at=None,
+            )
+        )
+        await db.commit()
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail={"detail": "Could not queue dispatch, campaign is awaiting approval again",
+                                    "code": "DISPATCH_ENQUEUE_FAILED"})
     return {"message": "Campaign approved and dispatch initiated"}
 
 
@@ -587,10 +602,10 @@ async def send_preview(
             campaign_id=campaign_id,
             contact_email=contact_email,
             channel="Email",
-            message_payload=str(content),
+            message_payload=content,
             send_status=send_status,
             provider_message_id=provider_message_id,
-            sent_at=datetime.utcnow() if send_status == "SENT" else None,
+            sent_at=datetime.now(timezone.utc) if send_status == "SENT" else None,
         )
         db.add(msg)
 
@@ -600,7 +615,7 @@ async def send_preview(
         channel="Email",
         event_type="SENT",
         payload=content,
-        occurred_at=datetime.utcnow(),
+        occurred_at=datetime.now(timezone.utc),
     )
     db.add(engage)
     await db.commit()
@@ -18,7 +18,7 @@ import copy
 import json
 import logging
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any, List
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
@@ -28,7 +28,7 @@ from app.core.database import AsyncSessionLocal
 from app.core.dependencies import get_ws_user
 from app.models.campaign import Campaign, PipelineState
 from app.models.pipeline import PipelineRun
-from app.services.dispatch_service import dispatch_campaign
+from app.worker.ai_tasks import run_dispatch
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["WebSocket"])
@@ -225,16 +225,44 @@ async def campaign_approval_ws(websocket: WebSocket, campaign_id: str):
                     pipeline_state=PipelineState.APPROVED,
                     approval_status="APPROVED",
                     approved_by=current_user.email,
-                    approved_at=datetime.utcnow(),
+                    approved_at=datetime.now(timezone.utc),
                 )
             )
             await db.execute(
                 update(PipelineRun)
                 .where(PipelineRun.campaign_id == campaign_uuid)
-                .values(state="APPROVED")
+                .values(state=PipelineState.APPROVED)
             )
             await db.commit()
 
+            # Hand dispatch to the Celery worker (blocking broker publish, off the loop)
+            try:
+                await asyncio.to_thread(run_dispatch.delay, str(campaign_uuid))
+            except Exception as exc:
+                logger.error(f"[WS] Could not queue dispatch for campaign {campaign_id}: {exc}", exc_info=True)
+                # No task will pick up APPROVED — put the campaign back so it can be re-approved
+                await db.execute(
+                    update(Campaign)
+                    .where(Campaign.id == campaign_uuid, Campaign.pipeline_state == PipelineState.APPROVED)
+                    .values(
+                        pipeline_state=PipelineState.AWAITING_APPROVAL,
+                        approval_status="PENDING",
+                        approved_by=None,
+                        approved_at=None,
+                    )
+                )
+                await db.execute(
+                    update(PipelineRun)
+                    .where(PipelineRun.campaign_id == campaign_uuid)
+                    .values(state=PipelineState.AWAITING_APPROVAL)
+                )
+                await db.commit()
+                await websocket.send_json({
+                    "error": "Could not queue dispatch, campaign is awaiting approval again",
+                    "code": "DISPATCH_ENQUEUE_FAILED",
+                })
+                return
+
             await websocket.send_json({
                 "type": "CAMPAIGN_APPROVED",
                 "campaign_id": str(campaign_uuid),
@@ -244,13 +272,6 @@ async def campaign_approval_ws(websocket: WebSocket, campaign_id: str):
 
             logger.info(f"[WS] Campaign {campaign_id} fully approved by {current_user.email}")
 
-            # Trigger dispatch asynchronously
-            async def _dispatch():
-                async with AsyncSessionLocal() as dispatch_db:
-                    await dispatch_campaign(dispatch_db, str(campaign_uuid))
-
-            asyncio.ensure_future(_dispatch())
-
         except WebSocketDisconnect:
             logger.warning(f"[WS] Client disconnected: {campaign_id}")
         except Exception as exc:
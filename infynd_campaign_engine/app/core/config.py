@@ -1,4 +1,7 @@
 import os
+import base64
+import tempfile
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
@@ -17,6 +20,11 @@ class Settings:
     API_V1_PREFIX: str = "/api/v1"
     DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
 
+    # HTTP server (uvicorn / gunicorn worker tuning)
+    HTTP_LIMIT_CONCURRENCY: int = int(os.getenv("HTTP_LIMIT_CONCURRENCY", 1000))
+    HTTP_BACKLOG: int = int(os.getenv("HTTP_BACKLOG", 2048))
+    HTTP_KEEPALIVE_TIMEOUT: int = int(os.getenv("HTTP_KEEPALIVE_TIMEOUT", 5))
+
     # Database
     DB_HOST: str = os.getenv("DB_HOST", "localhost")
     DB_PORT: int = int(os.getenv("DB_PORT", 5432))
@@ -25,6 +33,8 @@ class Settings:
     DB_PASSWORD: str = os.getenv("DB_PASSWORD", "1")
     DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 10))
     DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 20))
+    # Pre-ping costs a round-trip per checkout; enable only behind proxies that drop idle conns
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
 
     @property
     def DATABASE_URL(self) -> str:
@@ -77,6 +87,20 @@ class Settings:
     SENDGRID_REPLY_TO_EMAIL: str = os.getenv("SENDGRID_REPLY_TO_EMAIL", "")
     SENDGRID_WEBHOOK_SECRET: str = os.getenv("SENDGRID_WEBHOOK_SECRET", "")
 
+    @cached_property
+    def SENDGRID_WEBHOOK_PUBKEY(self):
+        # Base64 DER → ECDSA key object, parsed once on first webhook
+        if not self.SENDGRID_WEBHOOK_SECRET:
+            return None
+        from cryptography.hazmat.primitives.serialization import load_der_public_key
+        return load_der_public_key(base64.b64decode(self.SENDGRID_WEBHOOK_SECRET))
+
+    # Max /mail/send requests per second from this process (0 disables pacing)
+    SENDGRID_RPS: float = float(os.getenv("SENDGRID_RPS", 100))
+
+    # Dispatch — max in-flight SendGrid/Twilio requests per campaign dispatch
+    DISPATCH_CONCURRENCY: int = int(os.getenv("DISPATCH_CONCURRENCY", 50))
+
     # Google OAuth
     GOOGLE_CLIENT_ID: Optional[str] = os.getenv("GOOGLE_CLIENT_ID")
     GOOGLE_CLIENT_SECRET: Optional[str] = os.getenv("GOOGLE_CLIENT_SECRET")
@@ -86,6 +110,12 @@ class Settings:
     TWILIO_ACCOUNT_SID: str = os.getenv("TWILIO_ACCOUNT_SID", "")
     TWILIO_AUTH_TOKEN: str = os.getenv("TWILIO_AUTH_TOKEN", "")
     TWILIO_FROM_NUMBER: str = os.getenv("TWILIO_FROM_NUMBER", "")
+    # Prefixed to contact numbers stored without a "+" country code
+    DEFAULT_PHONE_COUNTRY_CODE: str = os.getenv("DEFAULT_PHONE_COUNTRY_CODE", "+91")
+
+    # Local TTS — synthesized call audio cached on disk (empty dir disables)
+    TTS_CACHE_DIR: str = os.getenv("TTS_CACHE_DIR", str(Path(tempfile.gettempdir()) / "infynd_tts"))
+    TTS_CACHE_MAX_MB: int = int(os.getenv("TTS_CACHE_MAX_MB", 256))
 
     # Ngrok (public webhook URL for Twilio callbacks)
     NGROK_BASE_URL: str = os.getenv("NGROK_BASE_URL", "")
@@ -1,3 +1,9 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
@@ -7,7 +13,7 @@ engine = create_async_engine(
     settings.DATABASE_URL,
     pool_size=settings.DB_POOL_SIZE,
     max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_pre_ping=True,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
     echo=settings.DEBUG,
 )
 
@@ -20,6 +26,27 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+@asynccontextmanager
+async def task_sessionmaker() -> AsyncIterator[async_sessionmaker]:
+    """
+    Session factory for one Celery task. Each task runs under its own
+    asyncio.run() loop and asyncpg connections can't outlive the loop that
+    opened them, so the shared pool above is off-limits: this engine holds no
+    pool and is disposed before the task's loop closes.
+    """
+    task_engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool, echo=settings.DEBUG)
+    try:
+        yield async_sessionmaker(
+            task_engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        )
+    finally:
+        await task_engine.dispose()
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -40,3 +67,13 @@ async def init_db():
     """Called on startup to verify connection."""
     async with engine.begin() as conn:
         await conn.run_sync(lambda c: None)
+
+
+async def warm_pool():
+    """Open pool_size connections up front so the first requests skip the handshake."""
+
+    async def _open():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_open() for _ in range(engine.pool.size())))
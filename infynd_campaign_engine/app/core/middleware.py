@@ -0,0 +1,56 @@
+"""
+Request logging middleware.
+
+Written as a plain ASGI callable rather than ``@app.middleware("http")`` so
+requests skip ``BaseHTTPMiddleware``'s request/response bridging and the
+extra task it spawns per call.
+"""
+
+import time
+
+import structlog
+
+logger = structlog.get_logger("app")
+
+# Probe and docs paths: high-frequency, no business value in logging them.
+_SKIP = frozenset({"/health", "/docs", "/redoc", "/openapi.json"})
+
+
+class RequestLoggingMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in _SKIP:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        start_time = time.perf_counter()
+        status_code = 500
+
+        logger.info(
+            "request", client=client[0] if client else None, method=method, path=path
+        )
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            logger.exception("request_failed", method=method, path=path, error=str(e))
+            raise
+
+        logger.info(
+            "response",
+            method=method,
+            path=path,
+            status=status_code,
+            ms=round((time.perf_counter() - start_time) * 1000, 2),
+        )
@@ -0,0 +1,19 @@
+"""
+Gunicorn worker class for production.
+
+``uvicorn.workers.UvicornWorker`` only forwards a handful of gunicorn
+settings to uvicorn; ``limit_concurrency`` is not one of them, so it is
+injected here from ``settings``. Backlog and keep-alive are passed on the
+gunicorn command line (``--backlog`` / ``--keep-alive``).
+"""
+
+from uvicorn.workers import UvicornWorker
+
+from app.core.config import settings
+
+
+class TunedUvicornWorker(UvicornWorker):
+    CONFIG_KWARGS = {
+        **UvicornWorker.CONFIG_KWARGS,
+        "limit_concurrency": settings.HTTP_LIMIT_CONCURRENCY,
+    }
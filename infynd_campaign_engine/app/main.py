@@ -1,15 +1,19 @@
 import logging
-import time
+import random
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
-from app.core.database import init_db
+from app.core.database import init_db, warm_pool
+from app.core.middleware import RequestLoggingMiddleware
+from app.services.localization_service import close_clients as close_translation_clients
 from app.services.logging_service import configure_logging
+from app.services.sendgrid_service import close_http_client as close_sendgrid_client
 
 # API routers
 from app.api.admin import router as admin_router
@@ -35,8 +39,12 @@ async def lifespan(app: FastAPI):
     logger.info(f"[Startup] {settings.APP_NAME} initializing...")
     await init_db()
     logger.info("[Startup] Database connection verified")
+    await warm_pool()
+    logger.info("[Startup] Database connection pool warmed")
     yield
     logger.info("[Shutdown] Application shutting down")
+    await close_translation_clients()
+    await close_sendgrid_client()
 
 
 app = FastAPI(
@@ -45,6 +53,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -54,32 +63,7 @@ PREFIX = settings.API_V1_PREFIX
 # ─────────────────────────────────────────────────────────────
 # REQUEST LOGGING MIDDLEWARE (PRINTS EVERYTHING)
 # ─────────────────────────────────────────────────────────────
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start_time = time.time()
-
-    logger.info(
-        f"[REQUEST] {request.client.host} "
-        f"{request.method} {request.url.path}"
-    )
-
-    try:
-        response = await call_next(request)
-    except Exception as e:
-        logger.exception(
-            f"[EXCEPTION] {request.method} {request.url.path} -> {str(e)}"
-        )
-        raise
-
-    process_time = round((time.time() - start_time) * 1000, 2)
-
-    logger.info(
-        f"[RESPONSE] {request.method} {request.url.path} "
-        f"Status: {response.status_code} "
-        f"Time: {process_time}ms"
-    )
-
-    return response
+app.add_middleware(RequestLoggingMiddleware)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -120,7 +104,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         f"[VALIDATION_ERROR] {request.method} {request.url.path} "
         f"{exc.errors()}"
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "detail": "Validation error",
@@ -130,12 +114,22 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
+_TRACEBACK_SAMPLE_RATE = 0.01
+
+
 @app.exception_handler(Exception)
 async def generic_exception_handler(request: Request, exc: Exception):
-    logger.exception(
-        f"[UNHANDLED_EXCEPTION] {request.method} {request.url.path}"
-    )
-    return JSONResponse(
+    # Formatting every traceback during a 5xx storm is expensive; outside DEBUG
+    # keep a one-line summary and only sample the occasional full traceback.
+    if settings.DEBUG or random.random() < _TRACEBACK_SAMPLE_RATE:
+        logger.exception(
+            f"[UNHANDLED_EXCEPTION] {request.method} {request.url.path}"
+        )
+    else:
+        logger.error(
+            f"[UNHANDLED_EXCEPTION] {request.method} {request.url.path}: {exc!r}"
+        )
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error", "code": "INTERNAL_ERROR"},
     )
@@ -144,10 +138,16 @@ async def generic_exception_handler(request: Request, exc: Exception):
 # ─────────────────────────────────────────────────────────────
 # HEALTH CHECK
 # ─────────────────────────────────────────────────────────────
-@app.get("/health", tags=["Health"])
+# Probes hit this every few seconds; the body never changes, so serialize it once.
+_HEALTH_RESPONSE = Response(
+    content=orjson.dumps({"status": "ok", "service": settings.APP_NAME}),
+    media_type="application/json",
+)
+
+
+@app.get("/health", tags=["Health"], include_in_schema=False)
 async def health():
-    logger.info("[HEALTH_CHECK] Service alive")
-    return {"status": "ok", "service": settings.APP_NAME}
+    return _HEALTH_RESPONSE
 
 
 # ─────────────────────────────────────────────────────────────
@@ -162,4 +162,8 @@ if __name__ == "__main__":
         port=8000,
         reload=True,
         log_level="debug",   # Forces terminal logs
+        # Shed load with fast 503s instead of letting loop latency explode
+        limit_concurrency=settings.HTTP_LIMIT_CONCURRENCY,
+        backlog=settings.HTTP_BACKLOG,
+        timeout_keep_alive=settings.HTTP_KEEPALIVE_TIMEOUT,
     )
\ No newline at end of file
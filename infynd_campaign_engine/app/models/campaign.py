@@ -1,11 +1,10 @@
-import uuid
-from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import (
-    Column, String, Text, Boolean, DateTime, JSON, Enum as SAEnum
+    Column, String, Text, Boolean, DateTime, Enum as SAEnum
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql import func, text
 import enum
 
 from app.core.database import Base
@@ -24,10 +23,15 @@ class PipelineState(str, enum.Enum):
     FAILED = "FAILED"
 
 
+# Shared by campaigns.pipeline_state and pipeline_runs.state so both columns
+# use the same native Postgres enum type.
+PIPELINE_STATE_ENUM = SAEnum(PipelineState, name="pipeline_state_enum")
+
+
 class Campaign(Base):
     __tablename__ = "campaigns"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     name = Column(String(255), nullable=False)
     company = Column(String(255))
     campaign_purpose = Column(Text)
@@ -39,17 +43,17 @@ class Campaign(Base):
     pipeline_locked = Column(Boolean, default=False)
 
     pipeline_state = Column(
-        SAEnum(PipelineState, name="pipeline_state_enum"),
+        PIPELINE_STATE_ENUM,
         default=PipelineState.CREATED,
         nullable=False,
     )
 
-    generated_content = Column(JSON, nullable=True)
+    generated_content = Column(JSONB, nullable=True)
 
     approval_status = Column(String(50), default="PENDING")
-    approved_at = Column(DateTime, nullable=True)
+    approved_at = Column(DateTime(timezone=True), nullable=True)
     approved_by = Column(String(255), nullable=True)
 
     created_by = Column(String(255))
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
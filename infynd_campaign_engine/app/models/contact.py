@@ -1,16 +1,15 @@
-import uuid
-from datetime import datetime
-
 from sqlalchemy import Column, String, Float, DateTime, Text, JSON, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func, text
 
+from app.core.config import settings
 from app.core.database import Base
 
 
 class Contact(Base):
     __tablename__ = "contacts"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     email = Column(String(255), unique=True, nullable=False, index=True)
     name = Column(String(255))
     role = Column(String(255))
@@ -22,16 +21,24 @@ class Contact(Base):
     callanswerrate = Column(Float, nullable=True)
     preferredtime = Column(String(100), nullable=True)
     phone_number = Column(String(50), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    @property
+    def phone_e164(self) -> str:
+        """phone_number with spaces stripped and a country code ensured; "" if unset."""
+        phone = (self.phone_number or "").strip().replace(" ", "")
+        if phone and not phone.startswith("+"):
+            phone = settings.DEFAULT_PHONE_COUNTRY_CODE + phone
+        return phone
 
 
 class ICPResult(Base):
     __tablename__ = "icp_results"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     contact_id = Column(UUID(as_uuid=True), ForeignKey("contacts.id"), nullable=False, index=True)
     buying_probability_score = Column(Float, nullable=True)
     icp_match = Column(String(50), nullable=True)
     notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
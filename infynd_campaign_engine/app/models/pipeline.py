@@ -1,34 +1,33 @@
-import uuid
-from datetime import datetime
-
-from sqlalchemy import Column, String, Text, DateTime, JSON, ForeignKey, Integer
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql import func, text
 
 from app.core.database import Base
+from app.models.campaign import PIPELINE_STATE_ENUM, PipelineState
 
 
 class PipelineRun(Base):
     __tablename__ = "pipeline_runs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     campaign_id = Column(UUID(as_uuid=True), ForeignKey("campaigns.id"), nullable=False)
-    state = Column(String(50), nullable=False, default="CREATED")
-    classification_summary = Column(JSON, nullable=True)
-    downstream_results = Column(JSON, nullable=True)
-    started_at = Column(DateTime, default=datetime.utcnow)
-    completed_at = Column(DateTime, nullable=True)
+    state = Column(PIPELINE_STATE_ENUM, nullable=False, default=PipelineState.CREATED)
+    classification_summary = Column(JSONB, nullable=True)
+    downstream_results = Column(JSONB, nullable=True)
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    completed_at = Column(DateTime(timezone=True), nullable=True)
     error_message = Column(Text, nullable=True)
 
 
 class CampaignLog(Base):
     __tablename__ = "campaign_logs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     campaign_id = Column(UUID(as_uuid=True), ForeignKey("campaigns.id"), nullable=False)
     agent_name = Column(String(100), nullable=False)
-    started_at = Column(DateTime, default=datetime.utcnow)
-    completed_at = Column(DateTime, nullable=True)
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    completed_at = Column(DateTime(timezone=True), nullable=True)
     duration_ms = Column(Integer, nullable=True)
     status = Column(String(50), nullable=False, default="RUNNING")
     error_message = Column(Text, nullable=True)
-    metadata_ = Column("metadata", JSON, nullable=True)
+    metadata_ = Column("metadata", JSONB, nullable=True)
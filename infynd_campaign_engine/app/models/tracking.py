@@ -1,58 +1,72 @@
-import uuid
-from datetime import datetime
-
-from sqlalchemy import Column, String, Text, DateTime, JSON, ForeignKey, BigInteger, Float
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, ForeignKey, BigInteger, Float, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql import func, text
 
 from app.core.database import Base
 
 
 class OutboundMessage(Base):
     __tablename__ = "outbound_messages"
+    __table_args__ = (
+        Index("ix_outbound_messages_campaign_channel", "campaign_id", "channel"),
+        Index("ix_outbound_messages_campaign_contact", "campaign_id", "contact_email"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    campaign_id = Column(UUID(as_uuid=True), ForeignKey("campaigns.id"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    campaign_id = Column(UUID(as_uuid=True), ForeignKey("campaigns.id"), nullable=False)
     contact_email = Column(String(255), nullable=False, index=True)
     channel = Column(String(50), nullable=False)
-    message_payload = Column(Text, nullable=True)
+    message_payload = Column(JSONB, nullable=True)
     send_status = Column(String(50), default="PENDING")
     provider_message_id = Column(String(255), nullable=True, index=True)
-    sent_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
 class EmailTrackingEvent(Base):
     __tablename__ = "email_tracking_events"
+    __table_args__ = (
+        Index("ix_email_tracking_events_campaign_event", "campaign_id", "event_type"),
+        Index("ix_email_tracking_events_raw_payload", "raw_payload", postgresql_using="gin"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    campaign_id = Column(UUID(as_uuid=True), nullable=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    campaign_id = Column(UUID(as_uuid=True), nullable=True)
     contact_email = Column(String(255), nullable=False, index=True)
     event_type = Column(String(50), nullable=False)
     message_id = Column(String(255), nullable=True)
     event_at = Column(BigInteger, nullable=True)
-    raw_payload = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    raw_payload = Column(JSONB, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
 class EngagementHistory(Base):
     __tablename__ = "engagement_history"
+    __table_args__ = (
+        Index("ix_engagement_history_campaign_event", "campaign_id", "event_type"),
+        Index("ix_engagement_history_campaign_time", "campaign_id", "occurred_at"),
+        Index("ix_engagement_history_campaign_contact", "campaign_id", "contact_email"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    campaign_id = Column(UUID(as_uuid=True), ForeignKey("campaigns.id"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    campaign_id = Column(UUID(as_uuid=True), ForeignKey("campaigns.id"), nullable=False)
     contact_email = Column(String(255), nullable=False, index=True)
     channel = Column(String(50), nullable=False)
     event_type = Column(String(50), nullable=False)
-    payload = Column(JSON, nullable=True)
-    occurred_at = Column(DateTime, default=datetime.utcnow)
+    payload = Column(JSONB, nullable=True)
+    occurred_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
 class ConversionEvent(Base):
     __tablename__ = "conversion_events"
+    __table_args__ = (
+        Index("ix_conversion_events_campaign_contact", "campaign_id", "contact_email"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    campaign_id = Column(UUID(as_uuid=True), ForeignKey("campaigns.id"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    campaign_id = Column(UUID(as_uuid=True), ForeignKey("campaigns.id"), nullable=False)
     contact_email = Column(String(255), nullable=False, index=True)
     event_type = Column(String(100), nullable=False)
     value = Column(Float, nullable=True)
-    metadata_ = Column("metadata", JSON, nullable=True)
-    occurred_at = Column(DateTime, default=datetime.utcnow)
+    metadata_ = Column("metadata", JSONB, nullable=True)
+    occurred_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import operator
 import uuid
 from datetime import datetime
 from typing import Optional, Dict, Any, List
@@ -37,10 +38,23 @@ class CampaignResponse(BaseModel):
 
     @classmethod
     def from_orm_campaign(cls, c: Any) -> "CampaignResponse":
-        """Map DB model to response, computing auto_approve_content."""
-        data = {k: getattr(c, k, None) for k in cls.model_fields}
+        """Map DB model to response, computing auto_approve_content.
+
+        ORM rows are already typed by SQLAlchemy, so validation is skipped.
+        """
+        data = dict(zip(_CAMPAIGN_ORM_FIELDS, _get_campaign_orm_fields(c)))
+        ps = data["pipeline_state"]
+        data["pipeline_state"] = ps.value if hasattr(ps, "value") else str(ps)
         data["auto_approve_content"] = not c.approval_required
-        return cls(**data)
+        return cls.model_construct(**data)
+
+
+# Resolved once at import: every response field that maps straight onto a
+# Campaign column (auto_approve_content is derived).
+_CAMPAIGN_ORM_FIELDS = tuple(
+    name for name in CampaignResponse.model_fields if name != "auto_approve_content"
+)
+_get_campaign_orm_fields = operator.attrgetter(*_CAMPAIGN_ORM_FIELDS)
 
 
 class ContentEditRequest(BaseModel):
@@ -5,21 +5,24 @@ per-contact placeholders (name, role, company, etc.) at send time.
 Strategy:
   1. Extract contact emails from generated_content["contacts"] (email → channel map).
   2. For each email, determine the channel assigned to that contact.
-  3. Fetch the Contact row from the DB for placeholder substitution.
+  3. Fetch Contact rows per chunk of recipients (one query each) for placeholder substitution.
   4. Take the common template for the channel, substitute all [PLACEHOLDER] tokens.
   5. Email  → send via SendGrid.
      Call   → initiate Twilio outbound call with voice agent.
      LinkedIn → log (no API integration yet).
 """
-import json
+import asyncio
 import logging
 import re
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
+import jinja2
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import load_only
 
 from app.models.campaign import Campaign, PipelineState
 from app.models.contact import Contact
@@ -31,162 +34,24 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Recipients per contact fetch / send / insert batch (bounds memory and IN-list size)
+_DISPATCH_CHUNK_SIZE = 1000
 
-def _substitute(template: Any, contact: "Contact | None", campaign: Campaign) -> Any:
-    """
-    Deep-copy *template* (dict or str) and replace every [PLACEHOLDER] token.
-    Supports any bracket token, including multi-word ones like [Your Name].
-    Returns the same type as the input.
-    """
-    if isinstance(template, dict):
-        return {k: _substitute(v, contact, campaign) for k, v in template.items()}
-
-    if not isinstance(template, str):
-        return template
-
-    def _replace(match: re.Match) -> str:
-        key = match.group(1).strip()
-        k = key.lower().replace(" ", "_")  # normalise: "Your Name" → "your_name"
-
-        # Contact fields
-        if contact:
-            if k in ("contact_name", "name"):          return contact.name or ""
-            if k in ("contact_role", "role"):          return contact.role or ""
-            if k in ("contact_company", "company"):    return contact.company or ""
-            if k == "email":                           return contact.email or ""
-            if k == "preferred_time":                  return str(contact.preferredtime or "")
-            if k == "email_click_rate":                return str(contact.emailclickrate or "")
-            if k == "linkedin_click_rate":             return str(contact.linkedinclickrate or "")
-            if k == "call_answer_rate":                return str(contact.callanswerrate or "")
-
-        # Campaign / sender fields
-        if k in ("product_link", "cta_link"):          return campaign.product_link or ""
-        if k in ("your_name", "sender", "from_name"):  return "Xyndrix Team"
-        if k == "campaign_name":                       return campaign.name or ""
-        if k == "company":                             return campaign.company or ""
-
-        # Unresolved — leave as-is so nothing is silently dropped
-        return match.group(0)
-
-    return re.sub(r"\[([^\]]+)\]", _replace, template)
-
-
-async def dispatch_campaign(db: AsyncSession, campaign_id: str) -> None:
-    """Send the common email/LinkedIn/call template to every approved contact."""
-
-    campaign_uuid = uuid.UUID(campaign_id)
-
-    # Fetch campaign
-    result = await db.execute(select(Campaign).where(Campaign.id == campaign_uuid))
-    campaign = result.scalar_one_or_none()
-    if not campaign:
-        logger.error(f"[Dispatch] Campaign {campaign_id} not found")
-        return
-    if campaign.pipeline_state not in (PipelineState.APPROVED,):
-        logger.warning(f"[Dispatch] Campaign {campaign_id} not in APPROVED state: {campaign.pipeline_state}")
-        return
-
-    generated: Dict[str, Any] = campaign.generated_content or {}
-
-    # Common templates — keyed by channel name
-    common_templates: Dict[str, Any] = generated.get("common") or {}
-
-    # contacts map: { "email@domain.com": "Email" | "Call" | "LinkedIn" }
-    contacts_map: Dict[str, str] = generated.get("contacts") or {}
-    contact_emails = [
-        email for email in contacts_map
-        if isinstance(email, str) and "@" in email
-    ]
-
-    if not contact_emails:
-        logger.warning(f"[Dispatch] Campaign {campaign_id} has no contacts")
-        return
-
-    if not common_templates:
-        logger.error(f"[Dispatch] Campaign {campaign_id} has no common templates")
-        return
-
-    logger.info(f"[Dispatch] Campaign {campaign_id}: dispatching to {len(contact_emails)} contacts")
-    dispatched_count = 0
-
-    for contact_email in contact_emails:
-        channel = contacts_map.get(contact_email, "Email")
-
-        # Idempotency guard
-        existing = await db.execute(
-            select(OutboundMessage).where(
-                OutboundMessage.campaign_id == campaign_uuid,
-                OutboundMessage.contact_email == contact_email,
-                OutboundMessage.channel == channel,
-                OutboundMessage.send_status == "SENT",
-            )
-        )
-        if existing.scalar_one_or_none():
-            logger.info(f"[Dispatch] Already sent to {contact_email} — skipping")
-            continue
-
-        # Fetch contact record for placeholder substitution
-        contact: "Contact | None" = None
-        try:
-            cr = await db.execute(select(Contact).where(Contact.email == contact_email))
-            contact = cr.scalar_one_or_none()
-        except Exception as exc:
-            logger.warning(f"[Dispatch] Could not fetch contact {contact_email}: {exc}")
-
-        # ── EMAIL ─────────────────────────────────────────────────────────
-        if channel == "Email":
-            template = common_templates.get("Email") or {}
-            if not template:
-                logger.warning(f"[Dispatch] No Email template for {contact_email}")
-                continue
-
-            import json as _json
-            content = _substitute(_json.loads(_json.dumps(template)), contact, campaign)
-
-            subject = content.get("subject", f"Message from {campaign.name}")
-            body    = content.get("body", "")
-            cta     = content.get("cta_link", campaign.product_link or "")
-            sender_name = settings.SENDGRID_FROM_NAME if hasattr(settings, "SENDGRID_FROM_NAME") else "InFynd Team"
-            reply_email = getattr(settings, "SENDGRID_REPLY_TO_EMAIL", None) or settings.SENDGRID_FROM_EMAIL
-
-            # ── Plain-text version (spam filters reward multipart/alternative) ──
-            plain_paragraphs = body.strip().replace("\r\n", "\n").split("\n\n")
-            plain_text = "\n\n".join(p.strip() for p in plain_paragraphs if p.strip())
-            if cta:
-                plain_text += f"\n\n{cta}\n"
-            plain_text += f"\n\n---\nTo stop receiving these emails, reply with 'Unsubscribe' to {reply_email}"
-
-            # ── Styled HTML email (proper DOCTYPE + structure avoids spam) ──
-            body_html = "".join(
-                f"<p style='margin:0 0 14px 0;'>{p.strip()}</p>"
-                for p in body.strip().replace("\r\n", "\n").split("\n\n")
-                if p.strip()
-            )
-            cta_block = (
-                f"""<table role='presentation' width='100%' cellpadding='0' cellspacing='0' style='margin:24px 0;'>
-                  <tr><td align='center'>
-                    <a href='{cta}' target='_blank'
-                       style='display:inline-block;background:#2563eb;color:#ffffff;font-family:Arial,sans-serif;
-                              font-size:14px;font-weight:600;text-decoration:none;padding:12px 28px;
-                              border-radius:6px;'>
-                      Learn More →
-                    </a>
-                  </td></tr>
-                </table>"""
-                if cta else ""
-            )
-            html_body = f"""<!DOCTYPE html>
+# Compiled once; rendered per recipient in the Email branch of dispatch_campaign.
+# Proper DOCTYPE + table layout keeps spam filters happy. Autoescape is on:
+# subject / body come from LLM output and must not inject markup.
+_EMAIL_HTML_TEMPLATE = jinja2.Template("""<!DOCTYPE html>
 <html lang='en'>
 <head>
   <meta charset='UTF-8' />
   <meta name='viewport' content='width=device-width,initial-scale=1.0' />
   <meta http-equiv='X-UA-Compatible' content='IE=edge' />
-  <title>{subject}</title>
+  <title>{{ subject }}</title>
 </head>
 <body style='margin:0;padding:0;background-color:#f4f4f5;font-family:Arial,Helvetica,sans-serif;'>
   <!-- preheader hidden preview text -->
   <div style='display:none;max-height:0;overflow:hidden;mso-hide:all;font-size:1px;color:#f4f4f5;line-height:1px;'>
-    {body[:90].replace(chr(10),' ')}&#847;&zwnj;&nbsp;
+    {{ preheader }}&#847;&zwnj;&nbsp;
   </div>
   <table role='presentation' width='100%' cellpadding='0' cellspacing='0' bgcolor='#f4f4f5'>
     <tr><td align='center' style='padding:32px 16px;'>
@@ -197,15 +62,24 @@ async def dispatch_campaign(db: AsyncSession, campaign_id: str) -> None:
         <tr>
           <td style='background:#2563eb;padding:24px 32px;'>
             <span style='font-size:20px;font-weight:700;color:#ffffff;letter-spacing:-0.3px;'>
-              {sender_name}
+              {{ sender_name }}
             </span>
           </td>
         </tr>
         <!-- Body -->
         <tr>
           <td style='padding:32px;color:#374151;font-size:15px;line-height:1.7;'>
-            {body_html}
-            {cta_block}
+            {% for p in paragraphs %}<p style='margin:0 0 14px 0;'>{{ p }}</p>{% endfor %}
+            {% if cta %}<table role='presentation' width='100%' cellpadding='0' cellspacing='0' style='margin:24px 0;'>
+                  <tr><td align='center'>
+                    <a href='{{ cta }}' target='_blank'
+                       style='display:inline-block;background:#2563eb;color:#ffffff;font-family:Arial,sans-serif;
+                              font-size:14px;font-weight:600;text-decoration:none;padding:12px 28px;
+                              border-radius:6px;'>
+                      Learn More →
+                    </a>
+                  </td></tr>
+                </table>{% endif %}
           </td>
         </tr>
         <!-- Footer -->
@@ -214,178 +88,443 @@ async def dispatch_campaign(db: AsyncSession, campaign_id: str) -> None:
                      text-align:center;color:#9ca3af;font-size:12px;line-height:1.6;'>
             <p style='margin:0 0 6px 0;'>
               You received this email because you match our target audience criteria.<br />
-              <a href='mailto:{reply_email}?subject=Unsubscribe'
+              <a href='mailto:{{ reply_email }}?subject=Unsubscribe'
                  style='color:#6b7280;text-decoration:underline;'>Unsubscribe</a>
               &nbsp;·&nbsp;
-              <a href='mailto:{reply_email}'
+              <a href='mailto:{{ reply_email }}'
                  style='color:#6b7280;text-decoration:underline;'>Reply</a>
             </p>
-            <p style='margin:0;'>{sender_name}</p>
+            <p style='margin:0;'>{{ sender_name }}</p>
           </td>
         </tr>
       </table>
     </td></tr>
   </table>
 </body>
-</html>"""
-
-            provider_message_id = None
-            send_status = "FAILED"
-            logger.info(f"[Dispatch] Sending Email → {contact_email}  subject={subject!r}")
-            try:
-                provider_message_id = await send_email(
-                    to_email=contact_email,
+</html>""", autoescape=True)
+
+
+def _campaign_subs(campaign: Campaign) -> Dict[str, str]:
+    """
+    Campaign / sender tokens — identical for every recipient, so templates
+    are pre-substituted with these once per dispatch.
+    Keys are normalised the same way as tokens: "Your Name" → "your_name".
+    """
+    return {
+        "product_link":  campaign.product_link or "",
+        "cta_link":      campaign.product_link or "",
+        "your_name":     "Xyndrix Team",
+        "sender":        "Xyndrix Team",
+        "from_name":     "Xyndrix Team",
+        "campaign_name": campaign.name or "",
+    }
+
+
+def _contact_subs(contact: "Contact | None", campaign: Campaign) -> Dict[str, str]:
+    """
+    Per-recipient tokens. [company] is the contact's company, falling back to
+    the campaign's when there is no contact record.
+    """
+    if not contact:
+        return {"company": campaign.company or ""}
+    return {
+        "contact_name":        contact.name or "",
+        "name":                contact.name or "",
+        "contact_role":        contact.role or "",
+        "role":                contact.role or "",
+        "contact_company":     contact.company or "",
+        "company":             contact.company or "",
+        "email":               contact.email or "",
+        "preferred_time":      str(contact.preferredtime or ""),
+        "email_click_rate":    str(contact.emailclickrate or ""),
+        "linkedin_click_rate": str(contact.linkedinclickrate or ""),
+        "call_answer_rate":    str(contact.callanswerrate or ""),
+    }
+
+
+# Only the Contact columns read by _contact_subs and the Call branch
+# (phone_e164 derives from phone_number); anything else would lazy-load.
+_DISPATCH_CONTACT_COLUMNS = (
+    Contact.email, Contact.name, Contact.role, Contact.company,
+    Contact.preferredtime, Contact.emailclickrate, Contact.linkedinclickrate,
+    Contact.callanswerrate, Contact.phone_number,
+)
+
+
+def _chunks(items: List[Any], size: int):
+    """Yield successive *size*-length slices of *items*."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+@lru_cache(maxsize=None)
+def _token_pattern(keys: Tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    Compile one alternation matching only the bracket tokens in *keys*, in any
+    case and with spaces or underscores ("[Your Name]", "[YOUR_NAME]"). The
+    substitution tables have a handful of fixed key sets, so this is compiled
+    once per set. Longest keys first so no key shadows a longer one.
+    """
+    alternation = "|".join(
+        re.escape(k).replace("_", "[ _]") for k in sorted(keys, key=len, reverse=True)
+    )
+    return re.compile(rf"\[\s*({alternation})\s*\]", re.IGNORECASE)
+
+
+def _substitute(template: Any, subs: Dict[str, str]) -> Any:
+    """
+    Deep-copy *template* (dict or str) and replace every [PLACEHOLDER] token
+    found in *subs* (see _campaign_subs / _contact_subs), including multi-word
+    ones like [Your Name]. Unknown tokens never match, so they are left as-is
+    and nothing is silently dropped. Returns the same type as the input.
+    """
+    if isinstance(template, dict):
+        return {k: _substitute(v, subs) for k, v in template.items()}
+
+    if not isinstance(template, str):
+        return template
+
+    return _token_pattern(tuple(subs)).sub(
+        lambda m: subs[m.group(1).lower().replace(" ", "_")], template
+    )
+
+
+async def dispatch_campaign(db: AsyncSession, campaign_id: str, resume: bool = False) -> None:
+    """
+    Send the common email/LinkedIn/call template to every approved contact.
+
+    resume=True is for a retry/redelivery of the same worker task: the campaign
+    may then already be DISPATCHED, and recipients whose rows an earlier
+    attempt committed are skipped.
+    """
+
+    campaign_uuid = uuid.UUID(campaign_id)
+
+    # Fetch campaign together with its latest pipeline run id in one round-trip
+    result = await db.execute(
+        select(Campaign, PipelineRun.id)
+        .outerjoin(PipelineRun, PipelineRun.campaign_id == Campaign.id)
+        .where(Campaign.id == campaign_uuid)
+        .order_by(PipelineRun.started_at.desc())
+        .limit(1)
+    )
+    row = result.one_or_none()
+    if not row:
+        logger.error(f"[Dispatch] Campaign {campaign_id} not found")
+        return
+    campaign, pipeline_run_id = row
+    # DISPATCHED = a dispatch is in progress; only the task that claimed it
+    # (on retry) may pick it up again.
+    start_states = (
+        (PipelineState.APPROVED, PipelineState.DISPATCHED) if resume else (PipelineState.APPROVED,)
+    )
+    if campaign.pipeline_state not in start_states:
+        logger.warning(f"[Dispatch] Campaign {campaign_id} not in APPROVED state: {campaign.pipeline_state}")
+        return
+
+    generated: Dict[str, Any] = campaign.generated_content or {}
+
+    # Common templates — keyed by channel name
+    common_templates: Dict[str, Any] = generated.get("common") or {}
+
+    # contacts map: { "email@domain.com": "Email" | "Call" | "LinkedIn" }
+    contacts_map: Dict[str, str] = generated.get("contacts") or {}
+    contact_pairs = [
+        (email, channel) for email, channel in contacts_map.items()
+        if isinstance(email, str) and "@" in email
+    ]
+    total_contacts = len(contact_pairs)
+
+    if not contact_pairs:
+        logger.warning(f"[Dispatch] Campaign {campaign_id} has no contacts")
+        return
+
+    if not common_templates:
+        logger.error(f"[Dispatch] Campaign {campaign_id} has no common templates")
+        return
+
+    logger.info(f"[Dispatch] Campaign {campaign_id}: dispatching to {total_contacts} contacts")
+    dispatched_count = 0
+
+    # Claim the campaign atomically — of two tasks racing on one campaign only
+    # one sees its state still APPROVED; committed so pollers see DISPATCHED.
+    claimed = await db.execute(
+        update(Campaign)
+        .where(Campaign.id == campaign_uuid, Campaign.pipeline_state.in_(start_states))
+        .values(pipeline_state=PipelineState.DISPATCHED)
+        .returning(Campaign.id)
+    )
+    if claimed.scalar_one_or_none() is None:
+        await db.rollback()
+        logger.warning(f"[Dispatch] Campaign {campaign_id} already claimed by another dispatch — skipping")
+        return
+    await db.commit()
+
+    # Idempotency guard — (email, channel) pairs already SENT for this campaign
+    sent_rows = await db.execute(
+        select(OutboundMessage.contact_email, OutboundMessage.channel).where(
+            OutboundMessage.campaign_id == campaign_uuid,
+            OutboundMessage.send_status == "SENT",
+        )
+    )
+    already_sent = {(r.contact_email, r.channel) for r in sent_rows}
+
+    # Campaign-level tokens resolve the same for every recipient — fill them
+    # once here; unresolved contact tokens are left for the per-contact pass.
+    campaign_subs = _campaign_subs(campaign)
+    staged_templates: Dict[str, Any] = {
+        ch: _substitute(tpl, campaign_subs) for ch, tpl in common_templates.items()
+    }
+
+    # Call context is the raw call template — identical for every Call recipient
+    call_template: Dict[str, Any] = common_templates.get("Call") or {}
+    call_script = " | ".join(
+        f"{k}: {v}" for k, v in call_template.items() if isinstance(v, str) and k != "cta_link"
+    )
+
+    campaign_id_str = str(campaign_uuid)
+    sem = asyncio.Semaphore(settings.DISPATCH_CONCURRENCY)
+
+    async def _dispatch_one(
+        contact_email: str, channel: str, contact: "Contact | None",
+    ) -> Optional[Tuple[Any, str, Optional[str], Optional[datetime]]]:
+        """
+        Send to one recipient. Returns (payload, send_status, provider_message_id,
+        sent_at) for the coordinator to persist, or None if the contact was skipped.
+        Touches no DB session — tasks run concurrently.
+        """
+        async with sem:
+            # ── EMAIL ─────────────────────────────────────────────────────────
+            if channel == "Email":
+                content = _substitute(staged_templates["Email"], _contact_subs(contact, campaign))
+
+                subject = content.get("subject", f"Message from {campaign.name}")
+                body    = content.get("body", "")
+                cta     = content.get("cta_link", campaign.product_link or "")
+                sender_name = settings.SENDGRID_FROM_NAME if hasattr(settings, "SENDGRID_FROM_NAME") else "InFynd Team"
+                reply_email = getattr(settings, "SENDGRID_REPLY_TO_EMAIL", None) or settings.SENDGRID_FROM_EMAIL
+
+                # Normalise and split the body once; both renderings use the paragraphs
+                paragraphs = [
+                    p.strip() for p in body.strip().replace("\r\n", "\n").split("\n\n") if p.strip()
+                ]
+
+                # ── Plain-text version (spam filters reward multipart/alternative) ──
+                plain_text = "\n\n".join(paragraphs)
+                if cta:
+                    plain_text += f"\n\n{cta}\n"
+                plain_text += f"\n\n---\nTo stop receiving these emails, reply with 'Unsubscribe' to {reply_email}"
+
+                # ── Styled HTML email (proper DOCTYPE + structure avoids spam) ──
+                html_body = _EMAIL_HTML_TEMPLATE.render(
                     subject=subject,
-                    html_body=html_body,
-                    plain_text=plain_text,
-                    campaign_id=str(campaign_uuid),
+                    preheader=body[:90].replace("\n", " "),
+                    sender_name=sender_name,
+                    paragraphs=paragraphs,
+                    cta=cta,
+                    reply_email=reply_email,
                 )
-                send_status = "SENT" if provider_message_id else "FAILED"
-                if provider_message_id:
-                    logger.info(f"[Dispatch] ✓ Email sent to {contact_email}")
-                else:
-                    logger.error(f"[Dispatch] ✗ Email FAILED for {contact_email}")
-            except Exception as exc:
-                logger.error(f"[Dispatch] Exception sending email to {contact_email}: {exc}")
-
-            db.add(OutboundMessage(
-                campaign_id=campaign_uuid,
-                contact_email=contact_email,
-                channel=channel,
-                message_payload=json.dumps(content),
-                send_status=send_status,
-                provider_message_id=provider_message_id,
-                sent_at=datetime.utcnow() if send_status == "SENT" else None,
-            ))
-            db.add(EngagementHistory(
-                campaign_id=campaign_uuid,
-                contact_email=contact_email,
-                channel=channel,
-                event_type="SENT",
-                payload=content,
-                occurred_at=datetime.utcnow(),
-            ))
-            dispatched_count += 1
 
-        # ── CALL (Twilio voice agent) ──────────────────────────────────────
-        elif channel == "Call":
-            template = common_templates.get("Call") or {}
-            if not template:
-                logger.warning(f"[Dispatch] No Call template for {contact_email}")
-                continue
+                provider_message_id = None
+                send_status = "FAILED"
+                logger.debug(f"[Dispatch] Sending Email → {contact_email}  subject={subject!r}")
+                try:
+                    provider_message_id = await send_email(
+                        to_email=contact_email,
+                        subject=subject,
+                        html_body=html_body,
+                        plain_text=plain_text,
+                        campaign_id=campaign_id_str,
+                    )
+                    send_status = "SENT" if provider_message_id else "FAILED"
+                    if provider_message_id:
+                        logger.debug(f"[Dispatch] ✓ Email sent to {contact_email}")
+                    else:
+                        logger.error(f"[Dispatch] ✗ Email FAILED for {contact_email}")
+                except Exception as exc:
+                    logger.error(f"[Dispatch] Exception sending email to {contact_email}: {exc}")
+                sent_at = datetime.now(timezone.utc) if send_status == "SENT" else None
+
+                return content, send_status, provider_message_id, sent_at
+
+            # ── CALL (Twilio voice agent) ──────────────────────────────────────
+            elif channel == "Call":
+                if not contact:
+                    logger.warning(f"[Dispatch] No contact record for {contact_email} — cannot call")
+                    return None
+
+                phone = contact.phone_e164
+                if not phone:
+                    logger.warning(f"[Dispatch] No phone number for {contact_email} — skipping call")
+                    return None
+
+                contact_dict = {
+                    "name":    getattr(contact, "name", ""),
+                    "email":   contact_email,
+                    "company": getattr(contact, "company", ""),
+                    "role":    getattr(contact, "role", ""),
+                }
+                try:
+                    call_result = await initiate_call(
+                        to_number=phone,
+                        contact=contact_dict,
+                        campaign_context=call_script,
+                        campaign_id=campaign_id_str,
+                    )
+                    logger.debug(f"[Dispatch] ✓ Call initiated for {contact_email}: {call_result}")
+                    send_status = "SENT"
+                    provider_message_id = call_result.get("call_sid")
+                except Exception as exc:
+                    logger.error(f"[Dispatch] ✗ Call FAILED for {contact_email}: {exc}")
+                    send_status = "FAILED"
+                    provider_message_id = None
+                sent_at = datetime.now(timezone.utc) if send_status == "SENT" else None
+
+                return call_template, send_status, provider_message_id, sent_at
+
+            # ── LINKEDIN ───────────────────────────────────────────────────────
+            elif channel == "LinkedIn":
+                content = _substitute(staged_templates["LinkedIn"], _contact_subs(contact, campaign))
+                logger.debug(f"[Dispatch] LinkedIn message prepared for {contact_email} (no API — logged only)")
+
+                return content, "SENT", None, datetime.now(timezone.utc)
 
-            if not contact:
-                logger.warning(f"[Dispatch] No contact record for {contact_email} — cannot call")
-                continue
+            logger.warning(f"[Dispatch] Unknown channel {channel!r} for {contact_email} — skipping")
+            return None
 
-            phone = (
-                getattr(contact, "phone_number", None)
-                or getattr(contact, "phoneno", None)
-                or getattr(contact, "phone", None)
-                or ""
-            )
-            phone = str(phone).strip().replace(" ", "")
-            if not phone:
-                logger.warning(f"[Dispatch] No phone number for {contact_email} — skipping call")
-                continue
-            if not phone.startswith("+"):
-                phone = "+91" + phone
+    # Channels with no (or an empty) common template are skipped up front,
+    # with one warning per channel rather than one per contact.
+    available_channels = {ch for ch, tpl in common_templates.items() if tpl}
+    missing_template: Dict[str, int] = {}
+
+    pending: List[Tuple[str, str]] = []
+    for contact_email, channel in contact_pairs:
+        if channel not in available_channels:
+            missing_template[channel] = missing_template.get(channel, 0) + 1
+            continue
+
+        if (contact_email, channel) in already_sent:
+            logger.debug(f"[Dispatch] Already sent to {contact_email} — skipping")
+            continue
+
+        pending.append((contact_email, channel))
+
+    for channel, count in missing_template.items():
+        logger.warning(f"[Dispatch] No {channel} template — skipping {count} contacts")
 
-            # Build campaign context from the call template
-            call_script = " | ".join(
-                f"{k}: {v}" for k, v in template.items() if isinstance(v, str) and k != "cta_link"
+    # occurred_at fallback for rows without a sent_at
+    now = datetime.now(timezone.utc)
+
+    # Recipients are processed in chunks: each chunk's Contact rows come from
+    # one bounded IN (...) query, are sent concurrently, and their message rows
+    # are written with one multi-row INSERT per table (insertmanyvalues), so
+    # a very large campaign never holds every Contact and row in memory.
+    # Each chunk's rows are committed right after its sends, so a retried task
+    # finds them SENT and doesn't re-send.
+    for chunk in _chunks(pending, _DISPATCH_CHUNK_SIZE):
+        contacts_by_email: Dict[str, Contact] = {}
+        try:
+            cr = await db.execute(
+                select(Contact)
+                .options(load_only(*_DISPATCH_CONTACT_COLUMNS))
+                .where(Contact.email.in_([email for email, _ in chunk]))
             )
-            contact_dict = {
-                "name":    getattr(contact, "name", ""),
-                "email":   contact_email,
-                "company": getattr(contact, "company", ""),
-                "role":    getattr(contact, "role", ""),
-            }
-            try:
-                call_result = await initiate_call(
-                    to_number=phone,
-                    contact=contact_dict,
-                    campaign_context=call_script,
-                    campaign_id=str(campaign_uuid),
-                )
-                logger.info(f"[Dispatch] ✓ Call initiated for {contact_email}: {call_result}")
-                send_status = "SENT"
-                provider_message_id = call_result.get("call_sid")
-            except Exception as exc:
-                logger.error(f"[Dispatch] ✗ Call FAILED for {contact_email}: {exc}")
-                send_status = "FAILED"
-                provider_message_id = None
+            contacts_by_email = {c.email: c for c in cr.scalars().all()}
+        except Exception as exc:
+            logger.warning(f"[Dispatch] Could not fetch contacts for campaign {campaign_id}: {exc}")
 
-            db.add(OutboundMessage(
-                campaign_id=campaign_uuid,
-                contact_email=contact_email,
-                channel=channel,
-                message_payload=json.dumps(template),
-                send_status=send_status,
-                provider_message_id=provider_message_id,
-                sent_at=datetime.utcnow() if send_status == "SENT" else None,
-            ))
-            db.add(EngagementHistory(
-                campaign_id=campaign_uuid,
-                contact_email=contact_email,
-                channel=channel,
-                event_type="SENT",
-                payload=template,
-                occurred_at=datetime.utcnow(),
-            ))
-            dispatched_count += 1
+        results = await asyncio.gather(
+            *(_dispatch_one(email, ch, contacts_by_email.get(email)) for email, ch in chunk),
+            return_exceptions=True,
+        )
 
-        # ── LINKEDIN ───────────────────────────────────────────────────────
-        elif channel == "LinkedIn":
-            template = common_templates.get("LinkedIn") or {}
-            if not template:
-                logger.warning(f"[Dispatch] No LinkedIn template for {contact_email}")
+        outbound_rows: List[Dict[str, Any]] = []
+        engagement_rows: List[Dict[str, Any]] = []
+        for (contact_email, channel), outcome in zip(chunk, results):
+            if isinstance(outcome, BaseException):
+                logger.error(f"[Dispatch] Unexpected error dispatching to {contact_email}: {outcome}")
+                continue
+            if outcome is None:
                 continue
 
-            import json as _json
-            content = _substitute(_json.loads(_json.dumps(template)), contact, campaign)
-            logger.info(f"[Dispatch] LinkedIn message prepared for {contact_email} (no API — logged only)")
-
-            db.add(OutboundMessage(
-                campaign_id=campaign_uuid,
-                contact_email=contact_email,
-                channel=channel,
-                message_payload=json.dumps(content),
-                send_status="SENT",
-                provider_message_id=None,
-                sent_at=datetime.utcnow(),
-            ))
-            db.add(EngagementHistory(
-                campaign_id=campaign_uuid,
-                contact_email=contact_email,
-                channel=channel,
-                event_type="SENT",
-                payload=content,
-                occurred_at=datetime.utcnow(),
-            ))
+            payload, send_status, provider_message_id, sent_at = outcome
+            if send_status == "FAILED":
+                # The rendered template carries nothing useful for a failed
+                # send; skip serialising it into two JSONB columns.
+                payload = None
+            outbound_rows.append({
+                "campaign_id": campaign_uuid,
+                "contact_email": contact_email,
+                "channel": channel,
+                "message_payload": payload,
+                "send_status": send_status,
+                "provider_message_id": provider_message_id,
+                "sent_at": sent_at,
+            })
+            engagement_rows.append({
+                "campaign_id": campaign_uuid,
+                "contact_email": contact_email,
+                "channel": channel,
+                "event_type": "SENT",
+                "payload": payload,
+                "occurred_at": sent_at or now,
+            })
             dispatched_count += 1
 
-        else:
-            logger.warning(f"[Dispatch] Unknown channel {channel!r} for {contact_email} — skipping")
-
-    # Commit all rows
-    await db.execute(
-        update(Campaign).where(Campaign.id == campaign_uuid)
-        .values(pipeline_state=PipelineState.DISPATCHED)
-    )
-    await db.commit()
+        if outbound_rows:
+            await db.execute(insert(OutboundMessage), outbound_rows)
+            await db.execute(insert(EngagementHistory), engagement_rows)
+            await db.commit()
 
+    # Terminal state transition
     await db.execute(
         update(Campaign).where(Campaign.id == campaign_uuid)
         .values(pipeline_state=PipelineState.COMPLETED)
     )
-    await db.execute(
-        update(PipelineRun).where(PipelineRun.campaign_id == campaign_uuid)
-        .values(state=PipelineState.COMPLETED, completed_at=datetime.utcnow())
-    )
+    if pipeline_run_id:
+        await db.execute(
+            update(PipelineRun).where(PipelineRun.id == pipeline_run_id)
+            .values(state=PipelineState.COMPLETED, completed_at=func.now())
+        )
     await db.commit()
 
     logger.info(
         f"[Dispatch] Campaign {campaign_id}: "
-        f"{dispatched_count}/{len(contact_emails)} messages dispatched → COMPLETED"
+        f"{dispatched_count}/{total_contacts} messages dispatched → COMPLETED"
+    )
+
+
+async def mark_dispatch_failed(db: AsyncSession, campaign_id: str, error: str) -> None:
+    """
+    Mark a campaign whose dispatch task ran out of retries FAILED, with its
+    latest pipeline run, so it does not sit in DISPATCHED forever. FAILED
+    campaigns can be regenerated and re-approved.
+    """
+    campaign_uuid = uuid.UUID(campaign_id)
+
+    result = await db.execute(
+        update(Campaign)
+        .where(
+            Campaign.id == campaign_uuid,
+            Campaign.pipeline_state.in_((PipelineState.APPROVED, PipelineState.DISPATCHED)),
+        )
+        .values(pipeline_state=PipelineState.FAILED)
+        .returning(Campaign.id)
     )
+    if result.scalar_one_or_none() is None:
+        await db.rollback()
+        return
+
+    latest_run_id = (
+        select(PipelineRun.id)
+        .where(PipelineRun.campaign_id == campaign_uuid)
+        .order_by(PipelineRun.started_at.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    await db.execute(
+        update(PipelineRun).where(PipelineRun.id == latest_run_id)
+        .values(state=PipelineState.FAILED, completed_at=func.now(), error_message=error)
+    )
+    await db.commit()
+    logger.warning(f"[Dispatch] Campaign {campaign_id} → FAILED: {error}")
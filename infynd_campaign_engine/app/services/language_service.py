@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
@@ -393,6 +394,12 @@ _LANGUAGE_NAME_MAP: Dict[str, LanguageConfig] = {
     "en": _ENGLISH_IN,
 }
 
+# Substring scan order: longest key first, so "new delhi" wins over "delhi"
+# and "south korea" over "korea" regardless of map insertion order.
+_LOCATION_ENTRIES_BY_LENGTH: tuple[tuple[str, LanguageConfig], ...] = tuple(
+    sorted(_LOCATION_MAP.items(), key=lambda kv: len(kv[0]), reverse=True)
+)
+
 
 def resolve_language_from_request(text: Optional[str]) -> Optional[LanguageConfig]:
     """Resolve a language config from explicit language mention in user text."""
@@ -405,38 +412,42 @@ def resolve_language_from_request(text: Optional[str]) -> Optional[LanguageConfi
     return None
 
 
+@lru_cache(maxsize=4096)
+def _resolve_normalized(loc: str) -> LanguageConfig:
+    """Resolve an already stripped + lowercased location. Pure, so memoised."""
+    # 1. Exact match
+    config = _LOCATION_MAP.get(loc)
+    if config is not None:
+        return config
+
+    # 2. Substring match — check if any key is contained in the location string
+    for key, config in _LOCATION_ENTRIES_BY_LENGTH:
+        if key in loc:
+            return config
+
+    # 3. Fallback
+    return DEFAULT_LANG
+
+
 def resolve_language(location: Optional[str]) -> LanguageConfig:
     """
     Resolve a contact's location string to a LanguageConfig.
 
     Matching strategy:
       1. Exact match (lowercased)
-      2. Substring match (location contains a known key)
+      2. Substring match (location contains a known key, longest key first)
       3. Fallback to English (US)
     """
     if not location:
         return DEFAULT_LANG
 
-    loc = location.strip().lower()
+    config = _resolve_normalized(location.strip().lower())
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[LanguageService] '{location}' → {config.name} ({config.code})")
+    return config
 
-    # 1. Exact match
-    if loc in _LOCATION_MAP:
-        logger.info(f"[LanguageService] Exact match: '{location}' → {_LOCATION_MAP[loc].name} ({_LOCATION_MAP[loc].code})")
-        return _LOCATION_MAP[loc]
 
-    # 2. Substring match — check if any key is contained in the location string
-    for key, config in _LOCATION_MAP.items():
-        if key in loc:
-            logger.info(f"[LanguageService] Substring match: '{location}' contains '{key}' → {config.name} ({config.code})")
-            return config
-
-    # 3. Fallback
-    logger.info(f"[LanguageService] No match for '{location}', falling back to English (US)")
-    return DEFAULT_LANG
-
-
-def get_supported_languages() -> list[dict[str, str]]:
-    """Return a list of unique supported languages (for reference / UI)."""
+def _build_supported_languages() -> tuple[dict[str, str], ...]:
     seen = set()
     langs = []
     for cfg in _LOCATION_MAP.values():
@@ -447,4 +458,13 @@ def get_supported_languages() -> list[dict[str, str]]:
                 "name": cfg.name,
                 "voice": cfg.twilio_voice,
             })
-    return sorted(langs, key=lambda x: x["name"])
+    return tuple(sorted(langs, key=lambda x: x["name"]))
+
+
+# The map is static, so the list is built once at import.
+_SUPPORTED_LANGUAGES = _build_supported_languages()
+
+
+def get_supported_languages() -> list[dict[str, str]]:
+    """Return a list of unique supported languages (for reference / UI)."""
+    return [dict(lang) for lang in _SUPPORTED_LANGUAGES]
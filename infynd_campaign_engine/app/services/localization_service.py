@@ -12,22 +12,92 @@ Strategy:
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import re
 from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
 
 import httpx
+import redis.asyncio as aioredis
+from cachetools import TTLCache
 
 from app.core.config import settings
 from app.services.language_service import LanguageConfig, resolve_language
 
 logger = logging.getLogger(__name__)
 
-# Translation cache: language_code → {content_type → translated_text}
-_translation_cache: Dict[str, Dict[str, str]] = {}
-_cache_timestamps: Dict[str, datetime] = {}
+# Translation cache, keyed on target language + a digest of the source text,
+# so identical text hits across content types and campaigns. Redis is shared
+# by every API / Celery worker; the bounded in-process TTLCache sits in front
+# of it and is the only cache when Redis is unreachable.
 CACHE_TTL_HOURS = 24
+CACHE_MAX_ENTRIES = 1024
+_translation_cache: TTLCache = TTLCache(maxsize=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_HOURS * 3600)
+_redis: Optional[aioredis.Redis] = None
+
+# Shared clients: keep connections to translate.googleapis.com (and Redis)
+# alive across calls instead of reconnecting per field / language. Both are
+# tied to the event loop that created them — Celery tasks each run under a
+# fresh asyncio.run() loop — and are rebuilt when it changes.
+_http_client: Optional[httpx.AsyncClient] = None
+_clients_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _bind_clients_to_running_loop() -> None:
+    global _http_client, _redis, _clients_loop
+    loop = asyncio.get_running_loop()
+    if _clients_loop is not loop:
+        _clients_loop = loop
+        _http_client = None
+        _redis = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared translation client for the running loop, creating it on first use."""
+    global _http_client
+    _bind_clients_to_running_loop()
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=32),
+            headers={"User-Agent": "Mozilla/5.0"},
+        )
+    return _http_client
+
+
+def _get_redis() -> aioredis.Redis:
+    """Return the Redis client for the shared translation cache (per running loop)."""
+    global _redis
+    _bind_clients_to_running_loop()
+    if _redis is None:
+        _redis = aioredis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=1,
+            socket_timeout=1,
+        )
+    return _redis
+
+
+async def close_clients() -> None:
+    """Close the shared HTTP and Redis clients (called on application shutdown)."""
+    global _http_client, _redis
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+# Several fields of one template travel in a single translate request,
+# joined by a marker the translator leaves alone.
+_BATCH_SEPARATOR = "\n\n|||\n\n"
+_BATCH_SPLIT_RE = re.compile(r"\s*\|\|\|\s*")
+# The text travels URL-encoded in the GET query string — keep each joined
+# request well under the endpoint's URL length limit.
+_BATCH_MAX_CHARS = 1800
 
 
 LANGUAGE_NAMES = {
@@ -61,10 +131,6 @@ async def _call_translation_api(
     try:
         # Using free Google Translate endpoint (for development)
         # For production, use: Google Cloud Translation, Azure Translator, or AWS Translate
-        url = "https://translate.googleapis.com/translate_a/element.js"
-        
-        # Alternative: Simple HTTP POST to translation service
-        headers = {"User-Agent": "Mozilla/5.0"}
         params = {
             "client": "gtx",
             "sl": source_lang,
@@ -72,32 +138,30 @@ async def _call_translation_api(
             "dt": "t",
             "q": text,
         }
-        
-        async with httpx.AsyncClient(timeout=10) as client:
-            # Using public Google Translate API endpoint
-            response = await client.get(
-                "https://translate.googleapis.com/translate_a/single",
-                params=params,
-                headers=headers,
-            )
-            
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    # Extract translated text from nested structure
-                    if isinstance(data, list) and len(data) > 0:
-                        translations = data[0]
-                        if isinstance(translations, list):
-                            translated = "".join([t[0] for t in translations if isinstance(t, list)])
-                            logger.info(f"[Localization] Translated {source_lang}→{target_lang}: {len(text)} → {len(translated)} chars")
-                            return translated
-                except (json.JSONDecodeError, IndexError, TypeError) as e:
-                    logger.warning(f"[Localization] Failed to parse translation response: {e}")
-                    return None
-            else:
-                logger.warning(f"[Localization] Translation API returned {response.status_code}")
+
+        # Using public Google Translate API endpoint
+        response = await _get_http_client().get(
+            "https://translate.googleapis.com/translate_a/single",
+            params=params,
+        )
+
+        if response.status_code == 200:
+            try:
+                data = response.json()
+                # Extract translated text from nested structure
+                if isinstance(data, list) and len(data) > 0:
+                    translations = data[0]
+                    if isinstance(translations, list):
+                        translated = "".join([t[0] for t in translations if isinstance(t, list)])
+                        logger.info(f"[Localization] Translated {source_lang}→{target_lang}: {len(text)} → {len(translated)} chars")
+                        return translated
+            except (json.JSONDecodeError, IndexError, TypeError) as e:
+                logger.warning(f"[Localization] Failed to parse translation response: {e}")
                 return None
-                
+        else:
+            logger.warning(f"[Localization] Translation API returned {response.status_code}")
+            return None
+
     except asyncio.TimeoutError:
         logger.warning(f"[Localization] Translation timeout: {source_lang}→{target_lang}")
         return None
@@ -125,6 +189,36 @@ async def _get_language_code_pair(lang_config: LanguageConfig) -> tuple[str, str
     return code_map.get(lang_config.code, ("en", "en"))
 
 
+def _cache_key(language_code: str, text: str) -> str:
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"tx:{language_code}:{digest}"
+
+
+async def _cache_get(language_code: str, text: str) -> Optional[str]:
+    """Return a cached translation of *text*, checking local then Redis."""
+    key = _cache_key(language_code, text)
+    cached = _translation_cache.get(key)
+    if cached is not None:
+        return cached
+    try:
+        cached = await _get_redis().get(key)
+    except Exception as exc:
+        logger.debug(f"[Localization] Redis cache unavailable: {exc}")
+        return None
+    if cached is not None:
+        _translation_cache[key] = cached
+    return cached
+
+
+async def _cache_set(language_code: str, text: str, translated: str) -> None:
+    key = _cache_key(language_code, text)
+    _translation_cache[key] = translated
+    try:
+        await _get_redis().set(key, translated, ex=CACHE_TTL_HOURS * 3600)
+    except Exception as exc:
+        logger.debug(f"[Localization] Redis cache unavailable: {exc}")
+
+
 async def translate_content(
     content: str,
     target_lang: LanguageConfig,
@@ -139,25 +233,17 @@ async def translate_content(
         return content
     
     # Check cache
-    cache_key = target_lang.code
-    if cache_key in _translation_cache:
-        cache_entry = _cache_timestamps.get(cache_key)
-        if cache_entry and datetime.now() - cache_entry < timedelta(hours=CACHE_TTL_HOURS):
-            cached = _translation_cache[cache_key].get(content_type)
-            if cached:
-                logger.info(f"[Localization] Cache hit for {target_lang.code}")
-                return cached
+    cached = await _cache_get(target_lang.code, content)
+    if cached:
+        logger.info(f"[Localization] Cache hit for {target_lang.code}")
+        return cached
     
     # Translate
     source_code, target_code = await _get_language_code_pair(target_lang)
     translated = await _call_translation_api(content, source_code, target_code)
     
     if translated:
-        # Cache result
-        if cache_key not in _translation_cache:
-            _translation_cache[cache_key] = {}
-        _translation_cache[cache_key][content_type] = translated
-        _cache_timestamps[cache_key] = datetime.now()
+        await _cache_set(target_lang.code, content, translated)
         return translated
     
     # Fallback to English
@@ -165,6 +251,79 @@ async def translate_content(
     return content
 
 
+async def _translate_batch(
+    batch: Dict[str, str],
+    target_lang: LanguageConfig,
+    source_code: str,
+    target_code: str,
+) -> Dict[str, str]:
+    """One API call for *batch*; any failure falls back to one call per field."""
+    if len(batch) > 1:
+        translated = await _call_translation_api(
+            _BATCH_SEPARATOR.join(batch.values()), source_code, target_code,
+        )
+        parts = _BATCH_SPLIT_RE.split(translated.strip()) if translated else []
+        if len(parts) == len(batch):
+            for value, part in zip(batch.values(), parts):
+                await _cache_set(target_lang.code, value, part)
+            return dict(zip(batch, parts))
+        logger.warning(
+            f"[Localization] Batch translation to {target_lang.code} returned {len(parts)} "
+            f"of {len(batch)} fields — translating individually"
+        )
+    results = await asyncio.gather(
+        *(translate_content(value, target_lang, field) for field, value in batch.items())
+    )
+    return dict(zip(batch, results))
+
+
+async def translate_fields(
+    fields: Dict[str, str],
+    target_lang: LanguageConfig,
+) -> Dict[str, str]:
+    """
+    Translate several named fields into one language in as few API calls as
+    the GET query length allows (_BATCH_MAX_CHARS per call). A batch that
+    fails or loses its separators is retried one field at a time.
+    """
+    if target_lang.code == "en-US":
+        return dict(fields)
+    
+    translated_fields: Dict[str, str] = {}
+    pending: Dict[str, str] = {}
+    for field, value in fields.items():
+        cached = await _cache_get(target_lang.code, value)
+        if cached:
+            translated_fields[field] = cached
+        else:
+            pending[field] = value
+    
+    if not pending:
+        return translated_fields
+    
+    # Pack fields greedily into batches whose joined text stays under the cap;
+    # a field longer than the cap travels alone.
+    batches: List[Dict[str, str]] = [{}]
+    batch_len = 0
+    for field, value in pending.items():
+        added = len(value) + (len(_BATCH_SEPARATOR) if batches[-1] else 0)
+        if batches[-1] and batch_len + added > _BATCH_MAX_CHARS:
+            batches.append({})
+            batch_len = 0
+            added = len(value)
+        batches[-1][field] = value
+        batch_len += added
+    
+    source_code, target_code = await _get_language_code_pair(target_lang)
+    results = await asyncio.gather(
+        *(_translate_batch(batch, target_lang, source_code, target_code) for batch in batches)
+    )
+    for result in results:
+        translated_fields.update(result)
+    
+    return translated_fields
+
+
 async def batch_translate_contacts(
     contacts: List[Dict[str, Any]],
     content: str,
@@ -174,27 +333,26 @@ async def batch_translate_contacts(
     Group contacts by language, translate content once per language.
     Returns: {contact_id → translated_content}
     """
-    language_groups: Dict[str, List[str]] = {}  # language_code → [contact_ids]
+    language_configs: Dict[str, LanguageConfig] = {}  # language_code → config
+    contact_langs: List[tuple[str, str]] = []  # (contact_id, language_code)
     
-    # Group contacts by language
+    # Group contacts by language — resolved once per contact, reused below
     for contact in contacts:
-        location = contact.get("location", "")
-        lang = resolve_language(location)
-        if lang.code not in language_groups:
-            language_groups[lang.code] = []
-        language_groups[lang.code].append(contact.get("id", contact.get("email", "")))
+        lang = resolve_language(contact.get("location", ""))
+        language_configs.setdefault(lang.code, lang)
+        contact_langs.append((contact.get("id", contact.get("email", "")), lang.code))
     
     # Translate once per language
     translations: Dict[str, str] = {}  # language_code → translated_content
     tasks = [
-        translate_content(content, resolve_language(""), content_type)
-        for lang_code in language_groups.keys()
+        translate_content(content, lang, content_type)
+        for lang in language_configs.values()
     ]
     
     # Execute translations in parallel
     if tasks:
         results = await asyncio.gather(*tasks, return_exceptions=True)
-        for (lang_code, contact_ids), result in zip(language_groups.items(), results):
+        for lang_code, result in zip(language_configs.keys(), results):
             if isinstance(result, Exception):
                 logger.error(f"[Localization] Error translating to {lang_code}: {result}")
                 translations[lang_code] = content  # Fallback to English
@@ -202,26 +360,24 @@ async def batch_translate_contacts(
                 translations[lang_code] = result
     
     # Map translations back to contacts
-    contact_translations = {}
-    for contact in contacts:
-        location = contact.get("location", "")
-        lang = resolve_language(location)
-        contact_id = contact.get("id", contact.get("email", ""))
-        contact_translations[contact_id] = translations.get(lang.code, content)
-    
-    return contact_translations
+    return {
+        contact_id: translations.get(lang_code, content)
+        for contact_id, lang_code in contact_langs
+    }
 
 
 def clear_translation_cache(language_code: Optional[str] = None):
-    """Clear translation cache for optimization."""
-    global _translation_cache, _cache_timestamps
+    """
+    Clear the in-process translation cache for optimization.
+    Shared Redis entries are left to expire after CACHE_TTL_HOURS.
+    """
     if language_code:
-        _translation_cache.pop(language_code, None)
-        _cache_timestamps.pop(language_code, None)
+        prefix = f"tx:{language_code}:"
+        for key in [k for k in _translation_cache if k.startswith(prefix)]:
+            _translation_cache.pop(key, None)
         logger.info(f"[Localization] Cleared cache for {language_code}")
     else:
         _translation_cache.clear()
-        _cache_timestamps.clear()
         logger.info("[Localization] Cleared all translation cache")
 
 
@@ -238,31 +394,27 @@ async def generate_localized_templates(
         "en-US": master_template,  # English is the master
     }
     
-    # Translate each template field
-    tasks = []
-    for lang in target_languages:
-        if lang.code == "en-US":
-            continue
-        
-        lang_templates = {}
-        for field, value in master_template.items():
-            if isinstance(value, str):
-                task = translate_content(value, lang, field)
-                tasks.append((lang.code, field, task))
+    # One batched translate call per language covering every string field
+    text_fields = {
+        field: value for field, value in master_template.items() if isinstance(value, str)
+    }
+    langs = [lang for lang in target_languages if lang.code != "en-US"]
     
-    # Execute all translations in parallel
-    if tasks:
-        results = await asyncio.gather(*[t[2] for t in tasks], return_exceptions=True)
+    # Execute all languages in parallel
+    if text_fields and langs:
+        results = await asyncio.gather(
+            *(translate_fields(text_fields, lang) for lang in langs),
+            return_exceptions=True,
+        )
         
-        for (lang_code, field, _), result in zip(tasks, results):
-            if lang_code not in localized:
-                localized[lang_code] = master_template.copy()
+        for lang, result in zip(langs, results):
+            localized[lang.code] = master_template.copy()
             
             if isinstance(result, Exception):
-                logger.error(f"[Localization] Error translating {field} to {lang_code}: {result}")
-                localized[lang_code][field] = master_template[field]  # Use English
+                logger.error(f"[Localization] Error translating template to {lang.code}: {result}")
+                # Fields stay English
             else:
-                localized[lang_code][field] = result
+                localized[lang.code].update(result)
     
     logger.info(f"[Localization] Generated localized templates for {len(localized)} languages")
     return localized
@@ -1,18 +1,30 @@
 """
 Structured JSON logging configuration.
 Outputs JSON logs with correlation_id and campaign_id propagation.
+
+The stdlib root logger (used across services and agents) gets the
+JSONFormatter below; the per-request access log goes through structlog,
+which renders straight to bytes with orjson and caches bound loggers.
 """
-import json
 import logging
 import sys
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+import orjson
+import structlog
+
+
+_EXTRA_FIELDS = ("campaign_id", "correlation_id", "agent_name", "contact_email")
 
 
 class JSONFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
+        # record.created is the event time the logging module already took;
+        # orjson renders the datetime natively (OPT_UTC_Z → trailing "Z").
         log_record = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -20,31 +32,47 @@ class JSONFormatter(logging.Formatter):
             "line": record.lineno,
         }
         # Add any extra fields
-        for key in ("campaign_id", "correlation_id", "agent_name", "contact_email"):
-            if hasattr(record, key):
-                log_record[key] = getattr(record, key)
+        extras = record.__dict__
+        for key in _EXTRA_FIELDS:
+            if key in extras:
+                log_record[key] = extras[key]
 
         if record.exc_info:
             log_record["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_record)
+        return orjson.dumps(log_record, option=orjson.OPT_UTC_Z).decode()
 
 
-def configure_logging(log_level: str = "INFO"):
+def configure_logging(log_level: str = "INFO", verbose_libs: Optional[Dict[str, str]] = None):
+    """
+    Install the JSON handler on the root logger at *log_level*.
+    Library loggers inherit that level; pass e.g.
+    ``{"sqlalchemy.engine": "DEBUG"}`` as *verbose_libs* to open one up.
+    """
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(JSONFormatter())
 
     root_logger = logging.getLogger()
-    # Force DEBUG for everything
-    root_logger.setLevel(logging.DEBUG)
+    root_logger.setLevel(log_level.upper())
 
     # Remove existing handlers
     root_logger.handlers.clear()
     root_logger.addHandler(handler)
 
-    # Set DEBUG for all major libraries
-    logging.getLogger("sqlalchemy.engine").setLevel(logging.DEBUG)
-    logging.getLogger("sqlalchemy.pool").setLevel(logging.DEBUG)
-    logging.getLogger("httpx").setLevel(logging.DEBUG)
-    logging.getLogger("uvicorn").setLevel(logging.DEBUG)
-    logging.getLogger("fastapi").setLevel(logging.DEBUG)
+    for name, level in (verbose_libs or {}).items():
+        logging.getLogger(name).setLevel(level.upper())
+
+    structlog.configure(
+        cache_logger_on_first_use=True,
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelName(log_level.upper())
+        ),
+        processors=[
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=orjson.dumps),
+        ],
+        logger_factory=structlog.BytesLoggerFactory(),
+    )
+
@@ -1,14 +1,23 @@
 """
-Pipeline Orchestrator — runs all 4 agents sequentially.
+Pipeline Orchestrator — runs the agents in dependency order.
 Each state transition is persisted atomically.
 Handles failures by marking the pipeline as FAILED.
+
+Dependency graph:
+  0 PromptParser ─┬─> 1 Classification ─> 2 ContactRetrieval ─> 3 ChannelDecision ─┐
+                  │                                                                 ├─> 4 persist content
+                  └─> 4 common-template LLM calls (campaign fields only) ───────────┘
+Agents 1–3 each read the previous agent's output, so they stay sequential on
+the pipeline session. The three template LLM calls need only the parsed
+campaign fields and no DB session, so they run concurrently with 1–3.
 """
+import asyncio
 import logging
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import update
 
 from app.core.database import AsyncSessionLocal
 from app.models.campaign import Campaign, PipelineState
@@ -17,77 +26,94 @@ from app.agents.prompt_parser_agent import run_prompt_parser_agent
 from app.agents.classification_agent import run_classification_agent
 from app.agents.contact_retrieval_agent import run_contact_retrieval_agent
 from app.agents.channel_decision_agent import run_channel_decision_agent
-from app.agents.content_generator_agent import run_content_generator_agent
-from app.services.dispatch_service import dispatch_campaign
+from app.agents.content_generator_agent import generate_common_templates, run_content_generator_agent
+from app.worker.ai_tasks import run_dispatch
 
 logger = logging.getLogger(__name__)
 
+# Campaign columns the prompt parser may fill in (read by later agents)
+_PARSED_CAMPAIGN_FIELDS = ["company", "platform", "campaign_purpose", "target_audience"]
+
+
+def _campaign_state_cte(campaign_uuid: uuid.UUID, state: PipelineState):
+    """
+    Terminal campaign UPDATE (state + unlock) as a data-modifying CTE. Attached
+    to the PipelineRun UPDATE with add_cte, both rows change in one statement:
+    WITH campaign_state AS (UPDATE campaigns ...) UPDATE pipeline_runs ...
+    """
+    return (
+        update(Campaign)
+        .where(Campaign.id == campaign_uuid)
+        .values(pipeline_state=state, pipeline_locked=False)
+        .returning(Campaign.id)
+        .cte("campaign_state")
+    )
+
 
-async def execute_pipeline(campaign_id: str):
+async def execute_pipeline(campaign_id: str, session_factory=AsyncSessionLocal):
     """
     Entry point called from Celery or BackgroundTasks.
-    Opens its own DB session for full async pipeline execution.
+    Opens its own DB session for full async pipeline execution; Celery passes
+    a per-task session_factory (see task_sessionmaker).
     """
-    async with AsyncSessionLocal() as db:
+    async with session_factory() as db:
+        templates_task = None
         try:
             campaign_uuid = uuid.UUID(campaign_id)
 
-            # Lock check — prevent concurrent execution
+            # Acquire the lock atomically — two workers racing on the same
+            # campaign can't both see it unlocked. RETURNING hands back the row.
             result = await db.execute(
-                select(Campaign).where(Campaign.id == campaign_uuid)
+                update(Campaign)
+                .where(Campaign.id == campaign_uuid, Campaign.pipeline_locked.isnot(True))
+                .values(pipeline_locked=True)
+                .returning(Campaign)
             )
             campaign = result.scalar_one_or_none()
 
             if not campaign:
-                logger.error(f"[Pipeline] Campaign {campaign_id} not found")
-                return
-
-            if campaign.pipeline_locked:
-                logger.warning(f"[Pipeline] Campaign {campaign_id} is locked — skipping")
+                await db.rollback()
+                logger.warning(f"[Pipeline] Campaign {campaign_id} not found or already locked — skipping")
                 return
-
-            # Lock the pipeline
-            await db.execute(
-                update(Campaign)
-                .where(Campaign.id == campaign_uuid)
-                .values(pipeline_locked=True)
-            )
             await db.commit()
 
             # Create pipeline_run record
             pipeline_run = PipelineRun(
                 campaign_id=campaign_uuid,
                 state=PipelineState.CREATED,
-                started_at=datetime.utcnow(),
+                started_at=datetime.now(timezone.utc),
             )
             db.add(pipeline_run)
             await db.commit()
-            await db.refresh(pipeline_run)
-            # Refresh campaign too
-            await db.refresh(campaign)
+
+            # Agents write through UPDATE statements and sessions don't expire
+            # on commit, so each step reloads only the columns the next one reads.
 
             # --- Agent 0: Prompt Parsing (extracts company, platform, purpose, audience) ---
             await run_prompt_parser_agent(db, campaign)
-            await db.refresh(campaign)
+            await db.refresh(campaign, attribute_names=_PARSED_CAMPAIGN_FIELDS)
+
+            # Template generation only needs the parsed fields — start it now
+            templates_task = asyncio.create_task(generate_common_templates(
+                campaign.campaign_purpose or "",
+                campaign.product_link or "",
+                campaign.prompt or "",
+            ))
 
             # --- Agent 1: Classification ---
             await run_classification_agent(db, campaign, pipeline_run)
-            await db.refresh(pipeline_run)
-            await db.refresh(campaign)
+            await db.refresh(pipeline_run, attribute_names=["classification_summary", "downstream_results"])
 
             # --- Agent 2: Contact Retrieval ---
             await run_contact_retrieval_agent(db, campaign, pipeline_run)
-            await db.refresh(pipeline_run)
-            await db.refresh(campaign)
+            await db.refresh(pipeline_run, attribute_names=["downstream_results"])
 
             # --- Agent 3: Channel Decision ---
             await run_channel_decision_agent(db, campaign, pipeline_run)
-            await db.refresh(pipeline_run)
-            await db.refresh(campaign)
+            await db.refresh(pipeline_run, attribute_names=["downstream_results"])
 
             # --- Agent 4: Content Generation ---
-            await run_content_generator_agent(db, campaign, pipeline_run)
-            await db.refresh(campaign)
+            await run_content_generator_agent(db, campaign, pipeline_run, templates=templates_task)
 
             # Move to AWAITING_APPROVAL or APPROVED
             next_state = (
@@ -95,51 +121,54 @@ async def execute_pipeline(campaign_id: str):
                 if campaign.approval_required
                 else PipelineState.APPROVED
             )
-            await db.execute(
-                update(Campaign)
-                .where(Campaign.id == campaign_uuid)
-                .values(
-                    pipeline_state=next_state,
-                    pipeline_locked=False,
-                )
-            )
             await db.execute(
                 update(PipelineRun)
                 .where(PipelineRun.id == pipeline_run.id)
-                .values(state=next_state, completed_at=datetime.utcnow())
+                .values(state=next_state, completed_at=datetime.now(timezone.utc))
+                .add_cte(_campaign_state_cte(campaign_uuid, next_state))
             )
             await db.commit()
 
             logger.info(f"[Pipeline] Campaign {campaign_id} completed → {next_state}")
 
-            # Auto-dispatch immediately when approval is not required
-            if not campaign.approval_required:
-                logger.info(f"[Pipeline] approval_required=False — auto-dispatching {campaign_id}")
-                async with AsyncSessionLocal() as dispatch_db:
-                    await dispatch_campaign(dispatch_db, campaign_id)
-
         except Exception as exc:
             logger.error(f"[Pipeline] Campaign {campaign_id} FAILED: {exc}", exc_info=True)
+            if templates_task is not None and not templates_task.done():
+                templates_task.cancel()
             try:
                 # Must rollback the poisoned transaction before issuing new SQL
                 await db.rollback()
-                await db.execute(
-                    update(Campaign)
-                    .where(Campaign.id == uuid.UUID(campaign_id))
-                    .values(
-                        pipeline_state=PipelineState.FAILED,
-                        pipeline_locked=False,
-                    )
-                )
                 await db.execute(
                     update(PipelineRun)
                     .where(PipelineRun.campaign_id == uuid.UUID(campaign_id))
                     .values(
                         state=PipelineState.FAILED,
-                        completed_at=datetime.utcnow(),
+                        completed_at=datetime.now(timezone.utc),
                         error_message=str(exc),
                     )
+                    .add_cte(_campaign_state_cte(uuid.UUID(campaign_id), PipelineState.FAILED))
                 )
                 await db.commit()
             except Exception as inner:
                 logger.critical(f"[Pipeline] Failed to persist FAILED state for {campaign_id}: {inner}")
+            return
+
+        # Auto-dispatch immediately when approval is not required. Outside the
+        # try above: the pipeline succeeded, so a broker error must not mark it FAILED.
+        if not campaign.approval_required:
+            logger.info(f"[Pipeline] approval_required=False — auto-dispatching {campaign_id}")
+            try:
+                await asyncio.to_thread(run_dispatch.delay, campaign_id)
+            except Exception as exc:
+                logger.error(f"[Pipeline] Could not queue dispatch for {campaign_id}: {exc}", exc_info=True)
+                # No task will pick up APPROVED — leave it for a manual approval instead
+                try:
+                    await db.execute(
+                        update(PipelineRun)
+                        .where(PipelineRun.id == pipeline_run.id)
+                        .values(state=PipelineState.AWAITING_APPROVAL)
+                        .add_cte(_campaign_state_cte(campaign_uuid, PipelineState.AWAITING_APPROVAL))
+                    )
+                    await db.commit()
+                except Exception as inner:
+                    logger.critical(f"[Pipeline] Failed to reset {campaign_id} to AWAITING_APPROVAL: {inner}")
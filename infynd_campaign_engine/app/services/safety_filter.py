@@ -14,6 +14,7 @@ Features:
 
 import re
 import logging
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 from enum import Enum
 
@@ -104,63 +105,144 @@ TONE_VIOLATIONS = [
     r"\b(all your friends|everyone is|trending now)\b",  # False social proof
 ]
 
+# Compiled once at import — scoring runs several times per template.
+# Patterns are all lowercase and run against text lowered once per score,
+# so no re.IGNORECASE is needed.
+_PROHIBITED_COMPILED: Dict[str, List[re.Pattern]] = {
+    category: [re.compile(p) for p in patterns]
+    for category, patterns in PROHIBITED_PATTERNS.items()
+}
+_TONE_COMPILED: List[re.Pattern] = [re.compile(p) for p in TONE_VIOLATIONS]
+
+# One alternation per category: a single search pass tells whether any of the
+# category's patterns match, so clean text costs one scan per category.
+_CATEGORY_UNION: Dict[str, re.Pattern] = {
+    category: re.compile("|".join(f"(?:{p})" for p in patterns))
+    for category, patterns in PROHIBITED_PATTERNS.items()
+}
+
+# Same unions, case-insensitive, for redacting violations in the original text
+_CATEGORY_REDACT: Dict[str, re.Pattern] = {
+    category: re.compile(union.pattern, re.IGNORECASE)
+    for category, union in _CATEGORY_UNION.items()
+}
+
+
+def _literal_matcher(phrases: List[str]) -> re.Pattern:
+    """One pass over lowered text finding any of *phrases* (longest first)."""
+    ordered = sorted((p.lower() for p in phrases), key=len, reverse=True)
+    return re.compile("|".join(re.escape(p) for p in ordered))
+
+
+# Multi-phrase substring scans: one regex pass instead of one `in` per phrase.
+# Phrases are paired with their lowercase form once, here, for the lookups.
+_TOPIC_MATCHER = _literal_matcher(PROHIBITED_TOPICS)
+_TOPICS_LOWER: List[Tuple[str, str]] = [(t, t.lower()) for t in PROHIBITED_TOPICS]
+_COMPLIANCE_MATCHERS: Dict[str, re.Pattern] = {
+    content_type: _literal_matcher(required)
+    for content_type, required in COMPLIANCE_REQUIREMENTS.items()
+}
+_COMPLIANCE_LOWER: Dict[str, List[Tuple[str, str]]] = {
+    content_type: [(d, d.lower()) for d in required]
+    for content_type, required in COMPLIANCE_REQUIREMENTS.items()
+}
+
+# Every pattern, topic and tone rule in one alternation. No hit means a clean
+# score (unless the content type needs disclaimers), so the usual safe
+# subject / body is decided in a single scan.
+_ANY_VIOLATION = re.compile("|".join(
+    [f"(?:{p})" for patterns in PROHIBITED_PATTERNS.values() for p in patterns]
+    + [re.escape(t.lower()) for t in PROHIBITED_TOPICS]
+    + [f"(?:{p})" for p in TONE_VIOLATIONS]
+))
+
 
-def _check_prohibited_patterns(text: str) -> List[Tuple[str, str]]:
-    """Check text against prohibited patterns. Returns list of (category, match)."""
+def _check_prohibited_patterns(text_lower: str) -> List[Tuple[str, str]]:
+    """Check lowered text against prohibited patterns. Returns list of (category, match)."""
     violations = []
-    text_lower = text.lower()
     
-    for category, patterns in PROHIBITED_PATTERNS.items():
+    for category, patterns in _PROHIBITED_COMPILED.items():
+        if not _CATEGORY_UNION[category].search(text_lower):
+            continue
+        # Hit — re-check per pattern, since each one is scored separately
         for pattern in patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
+            matches = pattern.findall(text_lower)
             if matches:
                 violations.append((category, matches[0]))
     
     return violations
 
 
-def _check_prohibited_topics(text: str) -> List[str]:
-    """Check if content mentions prohibited topics."""
-    text_lower = text.lower()
-    found_topics = []
-    
-    for topic in PROHIBITED_TOPICS:
-        if topic.lower() in text_lower:
-            found_topics.append(topic)
-    
-    return found_topics
+def _check_prohibited_topics(text_lower: str) -> List[str]:
+    """Check if (lowered) content mentions prohibited topics."""
+    found = {m.group(0) for m in _TOPIC_MATCHER.finditer(text_lower)}
+    if not found:
+        return []
+    return [topic for topic, topic_lower in _TOPICS_LOWER if topic_lower in found]
 
 
-def _check_tone_violations(text: str) -> List[str]:
-    """Check for manipulative tone patterns."""
+def _check_tone_violations(text_lower: str) -> List[str]:
+    """Check (lowered) content for manipulative tone patterns."""
     violations = []
     
-    for pattern in TONE_VIOLATIONS:
-        if re.search(pattern, text, re.IGNORECASE):
-            violations.append(pattern)
+    for pattern in _TONE_COMPILED:
+        if pattern.search(text_lower):
+            violations.append(pattern.pattern)
     
     return violations
 
 
-def _check_compliance_requirements(text: str, content_type: str) -> Tuple[bool, List[str]]:
+def _check_compliance_requirements(text_lower: str, content_type: str) -> Tuple[bool, List[str]]:
     """
-    Check if content includes required compliance disclaimers.
+    Check if (lowered) content includes required compliance disclaimers.
     Returns (compliant, missing_disclaimers).
     """
-    required = COMPLIANCE_REQUIREMENTS.get(content_type, [])
+    required = _COMPLIANCE_LOWER.get(content_type)
     if not required:
         return True, []
     
-    missing = []
-    text_lower = text.lower()
-    
-    for disclaimer in required:
-        if disclaimer.lower() not in text_lower:
-            missing.append(disclaimer)
+    present = {m.group(0) for m in _COMPLIANCE_MATCHERS[content_type].finditer(text_lower)}
+    missing = [disclaimer for disclaimer, lowered in required if lowered not in present]
     
     return len(missing) == 0, missing
 
 
+@lru_cache(maxsize=1024)
+def _score_content_cached(text: str, content_type: str) -> Tuple[int, tuple, tuple, tuple, tuple]:
+    """
+    Memoised scoring core. Templates are validated, filtered and re-validated
+    with the same text, so repeat calls are a cache hit. Returns immutable
+    parts only; score_content builds a fresh details dict per caller.
+    """
+    score = 100
+    text_lower = text.lower()  # every check below runs on this one copy
+    
+    # Fast path — nothing can match and no disclaimers are required
+    if content_type not in COMPLIANCE_REQUIREMENTS and not _ANY_VIOLATION.search(text_lower):
+        return score, (), (), (), ()
+    
+    # Check prohibited patterns
+    pattern_violations = _check_prohibited_patterns(text_lower)
+    score -= 50 * len(pattern_violations)
+    
+    # Check prohibited topics
+    topics = _check_prohibited_topics(text_lower)
+    score -= 30 * len(topics)
+    
+    # Check tone violations
+    tone_violations = _check_tone_violations(text_lower)
+    score -= 20 * len(tone_violations)
+    
+    # Check compliance
+    _, missing = _check_compliance_requirements(text_lower, content_type)
+    score -= 10 * len(missing)
+    
+    # Clamp score to 0-100
+    score = max(0, min(100, score))
+    
+    return score, tuple(pattern_violations), tuple(topics), tuple(tone_violations), tuple(missing)
+
+
 def score_content(
     text: str,
     content_type: str = "email",
@@ -176,41 +258,13 @@ def score_content(
       - -20 for tone violation
       - -10 for each missing compliance requirement
     """
-    score = 100
+    score, patterns, topics, tone, missing = _score_content_cached(text, content_type)
     details = {
-        "prohibited_patterns": [],
-        "prohibited_topics": [],
-        "tone_violations": [],
-        "missing_requirements": [],
+        "prohibited_patterns": list(patterns),
+        "prohibited_topics": list(topics),
+        "tone_violations": list(tone),
+        "missing_requirements": list(missing),
     }
-    
-    # Check prohibited patterns
-    pattern_violations = _check_prohibited_patterns(text)
-    if pattern_violations:
-        score -= 50 * len(pattern_violations)
-        details["prohibited_patterns"] = pattern_violations
-    
-    # Check prohibited topics
-    topics = _check_prohibited_topics(text)
-    if topics:
-        score -= 30 * len(topics)
-        details["prohibited_topics"] = topics
-    
-    # Check tone violations
-    tone_violations = _check_tone_violations(text)
-    if tone_violations:
-        score -= 20 * len(tone_violations)
-        details["tone_violations"] = tone_violations
-    
-    # Check compliance
-    compliant, missing = _check_compliance_requirements(text, content_type)
-    if not compliant:
-        score -= 10 * len(missing)
-        details["missing_requirements"] = missing
-    
-    # Clamp score to 0-100
-    score = max(0, min(100, score))
-    
     return score, details
 
 
@@ -231,20 +285,22 @@ def filter_content(text: str, content_type: str = "email") -> str:
         return text  # Safe to return as-is
     
     filtered = text
+    changed = False
     
-    # Remove prohibited patterns
-    for category, matches in details.get("prohibited_patterns", []):
-        for match in set([m[0] if isinstance(m, tuple) else m for m in matches]):
-            filtered = filtered.replace(match, "[removed]")
+    # Remove prohibited patterns — one substitution pass per violated category
+    for category in {category for category, _ in details.get("prohibited_patterns", [])}:
+        filtered, count = _CATEGORY_REDACT[category].subn("[removed]", filtered)
+        changed = changed or count > 0
     
     # Add required compliance if missing
     missing_reqs = details.get("missing_requirements", [])
     if missing_reqs:
         disclaimer = "\n\n" + " | ".join(missing_reqs)
         filtered += disclaimer
+        changed = True
     
-    # Re-score after filtering
-    new_score, _ = score_content(filtered, content_type)
+    # Re-score after filtering (unchanged text keeps its score)
+    new_score = score_content(filtered, content_type)[0] if changed else score
     logger.warning(
         f"[SafetyFilter] Content filtered: {score} → {new_score} (type={content_type})"
     )
@@ -273,21 +329,24 @@ def validate_email_template(
     # Check subject
     if not subject or len(subject) < 5:
         errors.append("Email subject too short or empty")
-    elif not is_safe_content(subject, "email"):
+    else:
         score, details = score_content(subject, "email")
-        errors.append(f"Subject line unsafe (score {score}): {details}")
+        if score < 70:
+            errors.append(f"Subject line unsafe (score {score}): {details}")
     
     # Check body
     if not body or len(body) < 20:
         errors.append("Email body too short or empty")
-    elif not is_safe_content(body, "email"):
+    else:
         score, details = score_content(body, "email")
-        errors.append(f"Email body unsafe (score {score}): {details}")
+        if score < 70:
+            errors.append(f"Email body unsafe (score {score}): {details}")
     
     # Check HTML
-    if html_body and not is_safe_content(html_body, "email"):
+    if html_body:
         score, details = score_content(html_body, "email")
-        errors.append(f"HTML body unsafe (score {score}): {details}")
+        if score < 70:
+            errors.append(f"HTML body unsafe (score {score}): {details}")
     
     return len(errors) == 0, errors
 
@@ -298,9 +357,10 @@ def validate_call_script(script: str) -> Tuple[bool, List[str]]:
     
     if not script or len(script) < 20:
         errors.append("Call script too short")
-    elif not is_safe_content(script, "call"):
+    else:
         score, details = score_content(script, "call")
-        errors.append(f"Call script unsafe (score {score}): {details}")
+        if score < 70:
+            errors.append(f"Call script unsafe (score {score}): {details}")
     
     # Check for natural tone
     if re.search(r"\[.*\]", script):
@@ -2,14 +2,26 @@
 SendGrid Service — sends emails via SendGrid API.
 Validates webhook ECDSA signature (Event Webhook v3).
 Includes automatic retry logic with exponential backoff.
+Sends are paced process-wide to SENDGRID_RPS to stay clear of 429s.
 """
 import asyncio
 import hashlib
 import base64
 import logging
-from typing import Optional
+import random
+import time
+from typing import Any, Dict, List, Optional
 
 import httpx
+import orjson
+
+try:
+    from cryptography.hazmat.primitives.asymmetric.ec import ECDSA
+    from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
+    from cryptography.hazmat.primitives.hashes import SHA256, Hash
+    _HAS_CRYPTOGRAPHY = True
+except ImportError:
+    _HAS_CRYPTOGRAPHY = False  # signature verification is skipped with a warning
 
 from app.core.config import settings
 
@@ -18,102 +30,226 @@ logger = logging.getLogger(__name__)
 SENDGRID_API_BASE = "https://api.sendgrid.com/v3"
 SENDGRID_MAX_RETRIES = 2
 SENDGRID_TIMEOUT = 30
+# /mail/send accepts at most 1000 personalizations per request
+SENDGRID_MAX_PERSONALIZATIONS = 1000
+# Webhook posts older/newer than this (seconds) or larger than this are rejected
+SENDGRID_WEBHOOK_MAX_AGE = 600
+SENDGRID_WEBHOOK_MAX_BYTES = 10 * 1024 * 1024
 
 
-async def send_email(
-    to_email: str,
+class _RateLimiter:
+    """
+    Paces callers to at most *rate* acquisitions per second by handing out
+    evenly spaced time slots. No lock is needed: the slot is claimed before
+    the only await.
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        if not self._interval:
+            return
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+_send_limiter = _RateLimiter(settings.SENDGRID_RPS)
+
+# One pooled HTTP/2 client for every send: connections to api.sendgrid.com
+# stay open instead of paying DNS + TCP + TLS per email. Celery tasks run each
+# dispatch under a fresh asyncio.run() loop, so the client is tied to the loop
+# that created it and rebuilt when that changes.
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared SendGrid client for the running loop, creating it on first use."""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client_loop = loop
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=SENDGRID_TIMEOUT,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared SendGrid client (called on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# Everything in a /mail/send body that depends only on settings — built once
+# at import so each send only adds its per-recipient parts.
+_REPLY_TO_EMAIL = settings.SENDGRID_REPLY_TO_EMAIL or settings.SENDGRID_FROM_EMAIL
+_STATIC_PAYLOAD: Dict[str, Any] = {
+    "from": {
+        "email": settings.SENDGRID_FROM_EMAIL,
+        "name": settings.SENDGRID_FROM_NAME,
+    },
+    "reply_to": {
+        "email": _REPLY_TO_EMAIL,
+        "name": settings.SENDGRID_FROM_NAME,
+    },
+    "tracking_settings": {
+        "click_tracking": {"enable": True},
+        "open_tracking": {"enable": True},
+    },
+    "mail_settings": {
+        "bypass_spam_management": {"enable": False},
+    },
+}
+_STATIC_HEADERS = {
+    # List-Unsubscribe makes Gmail route to Promotions instead of Spam
+    "List-Unsubscribe": f"<mailto:{_REPLY_TO_EMAIL}?subject=Unsubscribe>",
+    "List-Unsubscribe-Post": "List-Unsubscribe=One-Click",
+}
+_REQUEST_HEADERS = {
+    "Authorization": f"Bearer {settings.SENDGRID_API_KEY}",
+    "Content-Type": "application/json",
+}
+
+
+def _mail_payload(
+    personalizations: List[Dict[str, Any]],
     subject: str,
     html_body: str,
     campaign_id: str,
     plain_text: str = "",
-    message_id_prefix: str = "",
-) -> Optional[str]:
-    """Send an email via SendGrid with retry logic and return the X-Message-Id header."""
-    headers = {
-        "Authorization": f"Bearer {settings.SENDGRID_API_KEY}",
-        "Content-Type": "application/json",
-    }
-
-    reply_to_email = settings.SENDGRID_REPLY_TO_EMAIL or settings.SENDGRID_FROM_EMAIL
-
+) -> bytes:
+    """Serialize a /mail/send body; everything outside *personalizations* is shared."""
     # Build content blocks — always include plain-text to avoid spam flags
     content_blocks = []
     if plain_text:
         content_blocks.append({"type": "text/plain", "value": plain_text})
     content_blocks.append({"type": "text/html", "value": html_body})
 
-    payload = {
-        "personalizations": [
-            {
-                "to": [{"email": to_email}],
-                "custom_args": {
-                    "campaign_id": str(campaign_id),
-                },
-            }
-        ],
-        "from": {
-            "email": settings.SENDGRID_FROM_EMAIL,
-            "name": settings.SENDGRID_FROM_NAME,
-        },
-        "reply_to": {
-            "email": reply_to_email,
-            "name": settings.SENDGRID_FROM_NAME,
-        },
+    return orjson.dumps({
+        **_STATIC_PAYLOAD,
+        "personalizations": personalizations,
         "subject": subject,
         "content": content_blocks,
-        "headers": {
-            # List-Unsubscribe makes Gmail route to Promotions instead of Spam
-            "List-Unsubscribe": f"<mailto:{reply_to_email}?subject=Unsubscribe>",
-            "List-Unsubscribe-Post": "List-Unsubscribe=One-Click",
-            "X-Entity-Ref-ID": str(campaign_id),
-        },
-        "tracking_settings": {
-            "click_tracking": {"enable": True},
-            "open_tracking": {"enable": True},
-        },
-        "mail_settings": {
-            "bypass_spam_management": {"enable": False},
-        },
+        "headers": {**_STATIC_HEADERS, "X-Entity-Ref-ID": str(campaign_id)},
         "categories": [str(campaign_id)],
-    }
+    })
 
+
+def _backoff(attempt: int) -> float:
+    # ±50% jitter on a capped exponential — concurrent sends that failed
+    # together don't retry together
+    return min(2 ** attempt, 4) * (0.5 + random.random())
+
+
+async def _post_mail(payload: bytes, target: str) -> Optional[str]:
+    """POST a serialized /mail/send body with retry logic and return the X-Message-Id header."""
     for attempt in range(SENDGRID_MAX_RETRIES):
+        delay = _backoff(attempt)
         try:
-            async with httpx.AsyncClient(timeout=SENDGRID_TIMEOUT) as client:
-                response = await client.post(
-                    f"{SENDGRID_API_BASE}/mail/send",
-                    headers=headers,
-                    json=payload,
-                )
-                if response.status_code == 202:
-                    msg_id = response.headers.get("X-Message-Id", "")
-                    logger.info(f"[SendGrid] Sent to {to_email}, msg_id={msg_id}")
-                    return msg_id
-                elif response.status_code >= 500:
-                    # Retryable server error
-                    logger.warning(f"[SendGrid] Server error (attempt {attempt + 1}/{SENDGRID_MAX_RETRIES}): {response.status_code}")
-                    if attempt < SENDGRID_MAX_RETRIES - 1:
-                        await asyncio.sleep(0.5 * (attempt + 1))  # Exponential backoff
-                        continue
-                else:
-                    # Client error — don't retry
-                    logger.error(f"[SendGrid] Failed for {to_email}: {response.status_code} {response.text}")
-                    return None
-        except asyncio.TimeoutError:
-            logger.warning(f"[SendGrid] Timeout (attempt {attempt + 1}/{SENDGRID_MAX_RETRIES}) to {to_email}")
-            if attempt < SENDGRID_MAX_RETRIES - 1:
-                await asyncio.sleep(0.5 * (attempt + 1))
-                continue
+            await _send_limiter.acquire()
+            response = await _get_http_client().post(
+                f"{SENDGRID_API_BASE}/mail/send",
+                headers=_REQUEST_HEADERS,
+                content=payload,
+            )
+            if response.status_code == 202:
+                msg_id = response.headers.get("X-Message-Id", "")
+                logger.info(f"[SendGrid] Sent to {target}, msg_id={msg_id}")
+                return msg_id
+            elif response.status_code == 429 or response.status_code >= 500:
+                # Retryable: rate limited or server error. Honour Retry-After
+                # (seconds), capped so one header can't stall a dispatch.
+                logger.warning(f"[SendGrid] Retryable status (attempt {attempt + 1}/{SENDGRID_MAX_RETRIES}): {response.status_code}")
+                try:
+                    delay = min(float(response.headers.get("Retry-After", delay)), SENDGRID_TIMEOUT)
+                except ValueError:
+                    pass
+            else:
+                # Client error — don't retry
+                logger.error(f"[SendGrid] Failed for {target}: {response.status_code} {response.text}")
+                return None
+        except httpx.TimeoutException:
+            logger.warning(f"[SendGrid] Timeout (attempt {attempt + 1}/{SENDGRID_MAX_RETRIES}) to {target}")
         except Exception as exc:
-            logger.warning(f"[SendGrid] Exception (attempt {attempt + 1}/{SENDGRID_MAX_RETRIES}) to {to_email}: {exc}")
-            if attempt < SENDGRID_MAX_RETRIES - 1:
-                await asyncio.sleep(0.5 * (attempt + 1))
-                continue
-    
-    logger.error(f"[SendGrid] Failed to send to {to_email} after {SENDGRID_MAX_RETRIES} attempts")
+            logger.warning(f"[SendGrid] Exception (attempt {attempt + 1}/{SENDGRID_MAX_RETRIES}) to {target}: {exc}")
+        if attempt < SENDGRID_MAX_RETRIES - 1:
+            await asyncio.sleep(delay)
+
+    logger.error(f"[SendGrid] Failed to send to {target} after {SENDGRID_MAX_RETRIES} attempts")
     return None
 
 
+async def send_email(
+    to_email: str,
+    subject: str,
+    html_body: str,
+    campaign_id: str,
+    plain_text: str = "",
+    message_id_prefix: str = "",
+) -> Optional[str]:
+    """Send an email via SendGrid with retry logic and return the X-Message-Id header."""
+    personalizations = [
+        {
+            "to": [{"email": to_email}],
+            "custom_args": {
+                "campaign_id": str(campaign_id),
+            },
+        }
+    ]
+    payload = _mail_payload(personalizations, subject, html_body, campaign_id, plain_text)
+    return await _post_mail(payload, to_email)
+
+
+async def send_email_batch(
+    recipients: List[Dict[str, Any]],
+    subject: str,
+    html_body: str,
+    campaign_id: str,
+    plain_text: str = "",
+) -> List[Optional[str]]:
+    """
+    Send one shared email to many recipients, up to SENDGRID_MAX_PERSONALIZATIONS
+    per request. Each recipient dict needs "email" and may carry "recipient_id",
+    "subject" and "substitutions" (tokens SendGrid replaces in the shared body).
+
+    Returns one X-Message-Id per recipient, in order. SendGrid issues a single id
+    per request, so webhook events are told apart by the per-recipient
+    custom_args (campaign_id, recipient_id) rather than by message id.
+    """
+    message_ids: List[Optional[str]] = []
+    for start in range(0, len(recipients), SENDGRID_MAX_PERSONALIZATIONS):
+        chunk = recipients[start:start + SENDGRID_MAX_PERSONALIZATIONS]
+        personalizations = []
+        for r in chunk:
+            custom_args = {"campaign_id": str(campaign_id)}
+            if r.get("recipient_id") is not None:
+                custom_args["recipient_id"] = str(r["recipient_id"])
+            entry: Dict[str, Any] = {
+                "to": [{"email": r["email"]}],
+                "custom_args": custom_args,
+            }
+            if r.get("subject"):
+                entry["subject"] = r["subject"]
+            if r.get("substitutions"):
+                entry["substitutions"] = r["substitutions"]
+            personalizations.append(entry)
+
+        payload = _mail_payload(personalizations, subject, html_body, campaign_id, plain_text)
+        msg_id = await _post_mail(payload, f"{len(chunk)} recipients")
+        message_ids.extend([msg_id] * len(chunk))
+    return message_ids
+
+
 def verify_sendgrid_signature(
     payload: bytes,
     signature: str,
@@ -126,26 +262,38 @@ def verify_sendgrid_signature(
     if not settings.SENDGRID_WEBHOOK_SECRET:
         return True  # Bypass if not configured
 
-    try:
-        from cryptography.hazmat.primitives.asymmetric.ec import ECDSA
-        from cryptography.hazmat.primitives.hashes import SHA256
-        from cryptography.hazmat.primitives.serialization import load_der_public_key
-
-        # The signed content is timestamp + payload
-        signed_payload = timestamp.encode("utf-8") + payload
+    if not _HAS_CRYPTOGRAPHY:
+        logger.warning("[SendGrid] cryptography package not installed — skipping signature verification")
+        return True
 
-        # Decode the DER public key from base64
-        public_key_der = base64.b64decode(settings.SENDGRID_WEBHOOK_SECRET)
-        public_key = load_der_public_key(public_key_der)
+    # Cheapest rejections first: stale/garbled timestamp, oversized body
+    try:
+        if abs(time.time() - int(timestamp)) > SENDGRID_WEBHOOK_MAX_AGE:
+            logger.warning("[SendGrid] Webhook timestamp outside the freshness window")
+            return False
+    except ValueError:
+        logger.warning("[SendGrid] Webhook timestamp is not an integer")
+        return False
+    if len(payload) > SENDGRID_WEBHOOK_MAX_BYTES:
+        logger.warning(f"[SendGrid] Webhook body too large ({len(payload)} bytes)")
+        return False
 
+    try:
         # Decode the signature from base64
         sig_bytes = base64.b64decode(signature)
+        # A DER-encoded P-256 signature is at most 72 bytes, practically never under 64
+        if not 64 <= len(sig_bytes) <= 72:
+            logger.warning(f"[SendGrid] Signature has implausible length ({len(sig_bytes)} bytes)")
+            return False
 
-        # Verify
-        public_key.verify(sig_bytes, signed_payload, ECDSA(SHA256()))
-        return True
-    except ImportError:
-        logger.warning("[SendGrid] cryptography package not installed — skipping signature verification")
+        # The signed content is timestamp + payload — hash it in two updates
+        # rather than concatenating a copy of the whole body
+        digest = Hash(SHA256())
+        digest.update(timestamp.encode("utf-8"))
+        digest.update(payload)
+
+        # Verify against the key parsed once from settings
+        settings.SENDGRID_WEBHOOK_PUBKEY.verify(sig_bytes, digest.finalize(), ECDSA(Prehashed(SHA256())))
         return True
     except Exception as exc:
         logger.warning(f"[SendGrid] Signature verification failed: {exc}")
@@ -1,9 +1,35 @@
+import io
 import os
+import wave
+import shutil
+import struct
+import atexit
 import tempfile
+import threading
 import importlib
 import subprocess
 import base64
-from asyncio import to_thread
+import asyncio
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# One warm pyttsx3 engine per worker thread: pyttsx3.init() loads the driver,
+# enumerates voices and (on Windows) needs a COM apartment, which costs far
+# more than speaking a short line. COM is initialised once per thread and
+# left up for the engine's lifetime.
+_tls = threading.local()
+_engines: list = []
+
+# Dedicated bounded pool: synthesis blocks a thread for the whole utterance, so
+# it stays out of the default executor other to_thread work shares, and each
+# worker keeps its warm engine.
+_TTS_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="tts")
 
 
 def _co_initialize_if_windows() -> bool:
@@ -18,21 +44,11 @@ def _co_initialize_if_windows() -> bool:
         return False
 
 
-def _co_uninitialize_if_needed(initialized: bool) -> None:
-    if not initialized or os.name != "nt":
-        return
-    try:
-        import ctypes
-
-        ctypes.windll.ole32.CoUninitialize()
-    except Exception:
-        pass
-
+# Full path skips the PATH search; -NoLogo/-NonInteractive/-NoProfile trim startup
+_POWERSHELL_EXE = shutil.which("powershell") or r"C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe"
+_POWERSHELL_FLAGS = ["-NoLogo", "-NoProfile", "-NonInteractive", "-OutputFormat", "Text"]
 
-def _list_voices_powershell_sync() -> list[dict[str, str]]:
-    if os.name != "nt":
-        return []
-    script = r"""
+_PS_VOICES_SCRIPT = r"""
 Add-Type -AssemblyName System.Speech
 $synth = New-Object System.Speech.Synthesis.SpeechSynthesizer
 $voices = $synth.GetInstalledVoices() | ForEach-Object {
@@ -41,13 +57,30 @@ $voices = $synth.GetInstalledVoices() | ForEach-Object {
 }
 $voices | ConvertTo-Json -Compress
 """.strip()
-    result = subprocess.run(
-        ["powershell", "-NoProfile", "-Command", script],
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    raw = (result.stdout or "").strip()
+
+
+async def _run_powershell(script: str) -> str:
+    # Awaiting the child directly frees the worker thread a blocking
+    # subprocess.run would hold for PowerShell's whole startup
+    args = [_POWERSHELL_EXE, *_POWERSHELL_FLAGS, "-Command", script]
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+    except NotImplementedError:
+        # Selector event loops on Windows can't spawn subprocesses
+        result = await asyncio.to_thread(subprocess.run, args, check=True, capture_output=True)
+        return result.stdout.decode("utf-8", "replace").strip()
+    stdout, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError(f"PowerShell exited with {proc.returncode}: {stderr.decode('utf-8', 'replace').strip()}")
+    return stdout.decode("utf-8", "replace").strip()
+
+
+async def _list_voices_powershell_async() -> list[dict[str, str]]:
+    if os.name != "nt":
+        return []
+    raw = await _run_powershell(_PS_VOICES_SCRIPT)
     if not raw:
         return []
     import json
@@ -68,14 +101,68 @@ $voices | ConvertTo-Json -Compress
     return output
 
 
-def _synthesize_wav_powershell_sync(text: str, rate: int = 168, voice_id: str | None = None) -> bytes:
+def _sapi_rate(rate: int) -> int:
+    # SAPI / System.Speech rate range is -10..10
+    norm_rate = max(120, min(220, int(rate)))
+    return max(-10, min(10, int(round((norm_rate - 170) / 5))))
+
+
+# SpeechAudioFormatType SAFT22kHz16BitMono — the PCM layout written into the WAV header
+_SAPI_FORMAT = 22
+_SAPI_SAMPLE_RATE = 22050
+
+
+def _sapi_voice():
+    voice = getattr(_tls, "sapi_voice", None)
+    if voice is not None:
+        return voice
+    if not getattr(_tls, "co_init", False):
+        _tls.co_init = _co_initialize_if_windows()
+    win32com_client = importlib.import_module("win32com.client")
+    voice = win32com_client.Dispatch("SAPI.SpVoice")
+    _tls.sapi_voice = voice
+    _tls.sapi_default_voice = voice.Voice
+    return voice
+
+
+def _sapi_find_voice(voice, voice_id: str):
+    # Accept both pyttsx3 token ids and the display names list_voices() returns
+    tokens = voice.GetVoices()
+    for i in range(tokens.Count):
+        token = tokens.Item(i)
+        if voice_id in (token.Id, token.GetDescription()):
+            return token
+    return None
+
+
+def _synthesize_wav_sapi_sync(text: str, rate: int = 168, voice_id: str | None = None) -> bytes:
+    if os.name != "nt":
+        raise RuntimeError("SAPI speech fallback is only available on Windows")
+
+    voice = _sapi_voice()
+    win32com_client = importlib.import_module("win32com.client")
+    stream = win32com_client.Dispatch("SAPI.SpMemoryStream")
+    stream.Format.Type = _SAPI_FORMAT
+    voice.AudioOutputStream = stream
+    voice.Rate = _sapi_rate(rate)
+    voice.Voice = (voice_id and _sapi_find_voice(voice, voice_id)) or _tls.sapi_default_voice
+    voice.Speak(text)
+    pcm = bytes(stream.GetData())
+
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(_SAPI_SAMPLE_RATE)
+        wav.writeframes(pcm)
+    return buf.getvalue()
+
+
+async def _synthesize_wav_powershell_async(text: str, rate: int = 168, voice_id: str | None = None) -> bytes:
     if os.name != "nt":
         raise RuntimeError("PowerShell speech fallback is only available on Windows")
 
-    # System.Speech rate range is -10..10
-    norm_rate = max(120, min(220, int(rate)))
-    ps_rate = int(round((norm_rate - 170) / 5))
-    ps_rate = max(-10, min(10, ps_rate))
+    ps_rate = _sapi_rate(rate)
 
     text_b64 = base64.b64encode(text.encode("utf-8")).decode("ascii")
     voice_literal = (voice_id or "").replace("'", "''")
@@ -100,78 +187,276 @@ $outBytes = [System.IO.File]::ReadAllBytes($wav)
 [System.Convert]::ToBase64String($outBytes)
 """.strip()
 
-    result = subprocess.run(
-        ["powershell", "-NoProfile", "-Command", script],
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    out = (result.stdout or "").strip()
+    out = await _run_powershell(script)
     if not out:
         raise RuntimeError("PowerShell did not return audio bytes")
     return base64.b64decode(out)
 
 
-def _available_voices_sync() -> list[dict[str, str]]:
-    co_init = _co_initialize_if_windows()
-    try:
+_ESPEAK_EXE = shutil.which("espeak-ng") or shutil.which("espeak")
+
+
+def _synthesize_wav_espeak_sync(text: str, rate: int = 168, voice_id: str | None = None) -> bytes:
+    if not _ESPEAK_EXE:
+        raise RuntimeError("espeak-ng is not installed")
+
+    # eSpeak speed is words per minute, same scale as pyttsx3's rate
+    args = [_ESPEAK_EXE, "--stdin", "--stdout", "-s", str(max(120, min(220, int(rate))))]
+    if voice_id:
+        args += ["-v", voice_id]
+    result = subprocess.run(args, input=text.encode("utf-8"), check=True, capture_output=True)
+    data = result.stdout
+    if len(data) <= 44 or data[:4] != b"RIFF":
+        raise RuntimeError("espeak-ng did not return WAV audio")
+
+    # Streamed output can't seek back to fill in the RIFF/data sizes
+    if data[36:40] == b"data":
+        data = bytearray(data)
+        struct.pack_into("<I", data, 4, len(data) - 8)
+        struct.pack_into("<I", data, 40, len(data) - 44)
+        data = bytes(data)
+    return data
+
+
+def _thread_engine():
+    engine = getattr(_tls, "engine", None)
+    if engine is not None:
+        return engine
+    if not getattr(_tls, "co_init", False):
+        _tls.co_init = _co_initialize_if_windows()
+    pyttsx3 = importlib.import_module("pyttsx3")
+    # Engine() directly: pyttsx3.init() hands every thread the same cached engine
+    engine = pyttsx3.Engine()
+    _tls.engine = engine
+    _tls.rate = None
+    _tls.default_voice = _tls.voice = engine.getProperty("voice")
+    _engines.append(engine)
+    return engine
+
+
+def _discard_thread_engine() -> None:
+    engine = getattr(_tls, "engine", None)
+    _tls.engine = None
+    if engine is not None:
         try:
-            pyttsx3 = importlib.import_module("pyttsx3")
+            _engines.remove(engine)
+            engine.stop()
         except Exception:
-            return _list_voices_powershell_sync()
+            pass
 
-        engine = pyttsx3.init()
+
+@atexit.register
+def _stop_engines() -> None:
+    for engine in _engines:
         try:
-            voices = engine.getProperty("voices") or []
-            results: list[dict[str, str]] = []
-            for voice in voices:
-                vid = getattr(voice, "id", "") or ""
-                name = getattr(voice, "name", "") or vid
-                results.append({"id": str(vid), "name": str(name)})
-            if results:
-                return results
-        finally:
             engine.stop()
-        return _list_voices_powershell_sync()
+        except Exception:
+            pass
+
+
+def _available_voices_sync() -> list[dict[str, str]]:
+    engine = _thread_engine()
+    voices = engine.getProperty("voices") or []
+    results: list[dict[str, str]] = []
+    for voice in voices:
+        vid = getattr(voice, "id", "") or ""
+        name = getattr(voice, "name", "") or vid
+        results.append({"id": str(vid), "name": str(name)})
+    return results
+
+
+def _synthesize_wav_pyttsx3_sync(text: str, rate: int = 168, voice_id: str | None = None) -> bytes:
+    engine = _thread_engine()
+
+    # Only touch properties that changed since this thread's last call
+    normalized_rate = max(120, min(220, int(rate)))
+    if _tls.rate != normalized_rate:
+        engine.setProperty("rate", normalized_rate)
+        _tls.rate = normalized_rate
+    voice = voice_id or _tls.default_voice
+    if _tls.voice != voice:
+        engine.setProperty("voice", voice)
+        _tls.voice = voice
+
+    # pyttsx3 can only render to a file
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
+        wav_path = tmp.name
+
+    try:
+        engine.save_to_file(text, wav_path)
+        engine.runAndWait()
+        with open(wav_path, "rb") as fp:
+            return fp.read()
     finally:
-        _co_uninitialize_if_needed(co_init)
+        if os.path.exists(wav_path):
+            os.remove(wav_path)
 
 
 def _synthesize_wav_sync(text: str, rate: int = 168, voice_id: str | None = None) -> bytes:
-    co_init = _co_initialize_if_windows()
+    # In-memory first: SAPI on Windows, eSpeak piped to stdout elsewhere
     try:
-        pyttsx3 = importlib.import_module("pyttsx3")
+        if os.name == "nt":
+            return _synthesize_wav_sapi_sync(text, rate=rate, voice_id=voice_id)
+        if _ESPEAK_EXE:
+            return _synthesize_wav_espeak_sync(text, rate=rate, voice_id=voice_id)
+    except Exception:
+        _tls.sapi_voice = None
 
-        engine = pyttsx3.init()
-        normalized_rate = max(120, min(220, int(rate)))
-        engine.setProperty("rate", normalized_rate)
-        if voice_id:
-            engine.setProperty("voice", voice_id)
+    try:
+        return _synthesize_wav_pyttsx3_sync(text, rate=rate, voice_id=voice_id)
+    except Exception:
+        # A failed engine may be wedged — rebuild it on this thread's next call
+        _discard_thread_engine()
+        raise
+
+
+# ── On-disk audio cache ──────────────────────────────────────────────────────
+# Call scripts repeat across contacts (greeting, disclaimer, CTA), so rendered
+# WAVs are kept under TTS_CACHE_DIR/<key[:2]>/<key>.wav. Hits bump the mtime;
+# every _PRUNE_EVERY writes the oldest files are evicted down to the size cap.
+_CACHE_DIR = Path(settings.TTS_CACHE_DIR) if settings.TTS_CACHE_DIR else None
+_CACHE_MAX_BYTES = settings.TTS_CACHE_MAX_MB * 1024 * 1024
+_PRUNE_EVERY = 50
+_cache_writes = 0
+
+
+def _cache_path(text: str, rate: int, voice_id: str | None) -> Path | None:
+    if _CACHE_DIR is None:
+        return None
+    norm_rate = max(120, min(220, int(rate)))
+    key = hashlib.blake2b(f"{voice_id or ''}|{norm_rate}|{text}".encode("utf-8"), digest_size=16).hexdigest()
+    return _CACHE_DIR / key[:2] / f"{key}.wav"
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-            wav_path = tmp.name
 
+def _cache_read(path: Path) -> bytes | None:
+    try:
+        data = path.read_bytes()
+        os.utime(path)
+        return data
+    except OSError:
+        return None
+
+
+def _cache_write(path: Path, data: bytes) -> None:
+    global _cache_writes
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError:
+        return
+    _cache_writes += 1
+    if _cache_writes % _PRUNE_EVERY == 0:
+        _cache_prune()
+
+
+def _cache_prune() -> None:
+    entries = []
+    total = 0
+    for path in _CACHE_DIR.glob("*/*.wav"):
         try:
-            engine.save_to_file(text, wav_path)
-            engine.runAndWait()
-            engine.stop()
-            with open(wav_path, "rb") as fp:
-                return fp.read()
-        finally:
-            if os.path.exists(wav_path):
-                os.remove(wav_path)
-    except Exception:
-        return _synthesize_wav_powershell_sync(text, rate=rate, voice_id=voice_id)
-    finally:
-        _co_uninitialize_if_needed(co_init)
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+        total += st.st_size
+    if total <= _CACHE_MAX_BYTES:
+        return
+    entries.sort()
+    for _, size, path in entries:
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        if total <= _CACHE_MAX_BYTES * 0.9:
+            break
+
+
+# ── Compressed output ────────────────────────────────────────────────────────
+# PCM WAV is ~350 kbit/s at 22 kHz mono; Opus at 24 kbit/s is plenty for speech.
+_FFMPEG_EXE = shutil.which("ffmpeg")
+AUDIO_FORMATS: dict[str, tuple[str, list[str]]] = {
+    "wav": ("audio/wav", []),
+    "opus": ("audio/ogg", ["-c:a", "libopus", "-b:a", "24k", "-f", "ogg"]),
+    "mp3": ("audio/mpeg", ["-c:a", "libmp3lame", "-b:a", "48k", "-f", "mp3"]),
+}
+
+
+def _transcode_sync(wav: bytes, fmt: str) -> bytes:
+    result = subprocess.run(
+        [_FFMPEG_EXE, "-hide_banner", "-loglevel", "error", "-i", "pipe:0", *AUDIO_FORMATS[fmt][1], "pipe:1"],
+        input=wav,
+        check=True,
+        capture_output=True,
+    )
+    if not result.stdout:
+        raise RuntimeError(f"ffmpeg returned no {fmt} audio")
+    return result.stdout
+
+
+# Installed voices only change with OS configuration — enumerate once per
+# process. A tuple keeps the cached value immutable; refresh_voices() clears it.
+_voices_cache: tuple[tuple[str, str], ...] | None = None
 
 
 async def list_voices() -> list[dict[str, str]]:
-    return await to_thread(_available_voices_sync)
+    global _voices_cache
+    if _voices_cache is None:
+        voices: list[dict[str, str]] = []
+        if os.name == "nt":
+            try:
+                voices = await _list_voices_powershell_async()
+            except Exception:
+                voices = []
+        if not voices:
+            voices = await asyncio.get_running_loop().run_in_executor(_TTS_POOL, _available_voices_sync)
+        _voices_cache = tuple((v["id"], v["name"]) for v in voices)
+    return [{"id": vid, "name": name} for vid, name in _voices_cache]
+
+
+async def refresh_voices() -> list[dict[str, str]]:
+    global _voices_cache
+    _voices_cache = None
+    return await list_voices()
 
 
 async def synthesize_wav(text: str, rate: int = 168, voice_id: str | None = None) -> bytes:
     normalized = (text or "").strip()
     if not normalized:
         raise ValueError("Text is empty")
-    return await to_thread(_synthesize_wav_sync, normalized, rate, voice_id)
+    # Cache hits are a file read — keep them off the (possibly busy) TTS pool
+    path = _cache_path(normalized, rate, voice_id)
+    if path is not None:
+        cached = await asyncio.to_thread(_cache_read, path)
+        if cached is not None:
+            return cached
+    try:
+        data = await asyncio.get_running_loop().run_in_executor(
+            _TTS_POOL, _synthesize_wav_sync, normalized, rate, voice_id
+        )
+    except Exception:
+        if os.name != "nt":
+            raise
+        data = await _synthesize_wav_powershell_async(normalized, rate=rate, voice_id=voice_id)
+    if path is not None:
+        await asyncio.to_thread(_cache_write, path, data)
+    return data
+
+
+async def synthesize_audio(
+    text: str, rate: int = 168, voice_id: str | None = None, fmt: str = "opus"
+) -> tuple[bytes, str]:
+    """Return (audio bytes, format actually produced) — WAV when ffmpeg is unavailable or fails."""
+    if fmt not in AUDIO_FORMATS:
+        raise ValueError(f"Unsupported audio format: {fmt}")
+    wav = await synthesize_wav(text, rate=rate, voice_id=voice_id)
+    if fmt == "wav" or not _FFMPEG_EXE:
+        return wav, "wav"
+    try:
+        audio = await asyncio.get_running_loop().run_in_executor(_TTS_POOL, _transcode_sync, wav, fmt)
+    except (subprocess.CalledProcessError, RuntimeError, OSError) as exc:
+        logger.warning(f"[TTS] ffmpeg {fmt} transcode failed, serving WAV: {exc}")
+        return wav, "wav"
+    return audio, fmt
@@ -25,7 +25,7 @@ import threading
 import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 import httpx
@@ -131,7 +131,7 @@ async def save_conversation_to_db(call_sid: str, campaign_id: str) -> bool:
                 call_record.language_code = conv["language"].code
                 call_record.email_captured = conv.get("pending_email")
                 call_record.email_sent = 1 if conv["email_sent"] else 0
-                call_record.updated_at = datetime.utcnow()
+                call_record.updated_at = datetime.now(timezone.utc)
                 
                 await db.commit()
                 logger.info(f"[VoiceAgent] Saved conversation state for {call_sid}")
@@ -457,7 +457,7 @@ async def _save_contact_email(conv: Dict[str, Any], email: str) -> None:
             result = await db.execute(
                 update(Contact)
                 .where(Contact.id == uuid.UUID(str(contact_id)))
-                .values(email=email, updated_at=datetime.utcnow())
+                .values(email=email, updated_at=datetime.now(timezone.utc))
             )
             await db.commit()
             
@@ -912,9 +912,7 @@ async def call_campaign_contacts(
     results: List[Dict[str, Any]] = []
 
     for contact in contact_records:
-        # Prefer phone_number column if present, else fallback
-        phone = getattr(contact, "phone_number", None) or getattr(contact, "phoneno", None) or getattr(contact, "phone", None) or ""
-        phone = str(phone).strip().replace(" ", "")
+        phone = contact.phone_e164
 
         logger.info(f"[VoiceAgent] Contact: {contact.name} | email={contact.email} | phone={phone!r}")
 
@@ -929,10 +927,6 @@ async def call_campaign_contacts(
             })
             continue
 
-        # Ensure E.164 format
-        if not phone.startswith("+"):
-            phone = "+91" + phone
-
         contact_dict = {
             "contact_id": str(contact.id) if getattr(contact, "id", None) else None,
             "name": contact.name,
@@ -994,7 +988,7 @@ async def update_call_status(call_sid: str, status: str) -> None:
         async with AsyncSessionLocal() as db:
             values: Dict[str, Any] = {
                 "status": status,
-                "updated_at": datetime.utcnow(),
+                "updated_at": datetime.now(timezone.utc),
             }
             if conv and conv.get("turns"):
                 values["conversation_log"] = conv["turns"]
@@ -6,6 +6,18 @@ from app.worker.celery_app import celery_app
 logger = logging.getLogger(__name__)
 
 
+async def _close_loop_clients() -> None:
+    """
+    Close the shared clients bound to this task's event loop while it still
+    runs — the next task's fresh loop would otherwise orphan them, sockets and all.
+    """
+    from app.services.localization_service import close_clients as close_translation_clients
+    from app.services.sendgrid_service import close_http_client
+
+    await close_http_client()
+    await close_translation_clients()
+
+
 @celery_app.task(
     bind=True,
     max_retries=3,
@@ -18,8 +30,17 @@ def run_campaign_pipeline(self, campaign_id: str):
     Called from API as a background task or queued via Celery.
     """
     try:
+        from app.core.database import task_sessionmaker
         from app.services.pipeline_runner import execute_pipeline
-        asyncio.run(execute_pipeline(campaign_id))
+
+        async def _pipeline():
+            try:
+                async with task_sessionmaker() as session_factory:
+                    await execute_pipeline(campaign_id, session_factory=session_factory)
+            finally:
+                await _close_loop_clients()
+
+        asyncio.run(_pipeline())
         logger.info(f"[CeleryTask] Pipeline completed for campaign {campaign_id}")
     except Exception as exc:
         logger.error(f"[CeleryTask] Pipeline failed for campaign {campaign_id}: {exc}", exc_info=True)
@@ -37,16 +58,44 @@ def run_dispatch(self, campaign_id: str):
     Celery task: handles dispatch after campaign approval.
     """
     try:
-        import asyncio
-        from app.core.database import AsyncSessionLocal
+        from app.core.database import task_sessionmaker
         from app.services.dispatch_service import dispatch_campaign
 
+        # A retry or acks_late redelivery of this task may resume the
+        # DISPATCHED campaign it claimed; a fresh task may not.
+        delivery_info = self.request.delivery_info or {}
+        resume = self.request.retries > 0 or bool(delivery_info.get("redelivered"))
+
         async def _dispatch():
-            async with AsyncSessionLocal() as db:
-                await dispatch_campaign(db, campaign_id)
+            try:
+                async with task_sessionmaker() as session_factory:
+                    async with session_factory() as db:
+                        await dispatch_campaign(db, campaign_id, resume=resume)
+            finally:
+                await _close_loop_clients()
 
         asyncio.run(_dispatch())
         logger.info(f"[CeleryTask] Dispatch completed for campaign {campaign_id}")
     except Exception as exc:
         logger.error(f"[CeleryTask] Dispatch failed for campaign {campaign_id}: {exc}", exc_info=True)
+        if self.request.retries >= self.max_retries:
+            # Out of retries — release the campaign from DISPATCHED before giving up
+            _fail_dispatch(campaign_id, str(exc))
+            raise
         raise self.retry(exc=exc, countdown=5)
+
+
+def _fail_dispatch(campaign_id: str, error: str) -> None:
+    """Persist the FAILED state for a dispatch that exhausted its retries."""
+    from app.core.database import task_sessionmaker
+    from app.services.dispatch_service import mark_dispatch_failed
+
+    async def _mark():
+        async with task_sessionmaker() as session_factory:
+            async with session_factory() as db:
+                await mark_dispatch_failed(db, campaign_id, error)
+
+    try:
+        asyncio.run(_mark())
+    except Exception as inner:
+        logger.critical(f"[CeleryTask] Failed to persist FAILED state for campaign {campaign_id}: {inner}")
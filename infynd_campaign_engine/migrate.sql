@@ -24,13 +24,13 @@ CREATE TABLE IF NOT EXISTS campaigns (
     approval_required BOOLEAN      NOT NULL DEFAULT TRUE,
     pipeline_locked   BOOLEAN      NOT NULL DEFAULT FALSE,
     pipeline_state    pipeline_state_enum NOT NULL DEFAULT 'CREATED',
-    generated_content JSON,
+    generated_content JSONB,
     approval_status   VARCHAR(50)  DEFAULT 'PENDING',
-    approved_at       TIMESTAMP,
+    approved_at       TIMESTAMPTZ,
     approved_by       VARCHAR(255),
     created_by        VARCHAR(255),
-    created_at        TIMESTAMP    NOT NULL DEFAULT NOW(),
-    updated_at        TIMESTAMP    NOT NULL DEFAULT NOW()
+    created_at        TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+    updated_at        TIMESTAMPTZ  NOT NULL DEFAULT NOW()
 );
 
 CREATE TABLE IF NOT EXISTS contacts (
@@ -46,8 +46,8 @@ CREATE TABLE IF NOT EXISTS contacts (
     callanswerrate    FLOAT,
     preferredtime     VARCHAR(100),
     phone_number      VARCHAR(50),
-    created_at        TIMESTAMP    NOT NULL DEFAULT NOW(),
-    updated_at        TIMESTAMP    NOT NULL DEFAULT NOW()
+    created_at        TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+    updated_at        TIMESTAMPTZ  NOT NULL DEFAULT NOW()
 );
 CREATE INDEX IF NOT EXISTS ix_contacts_email ON contacts (email);
 
@@ -57,18 +57,18 @@ CREATE TABLE IF NOT EXISTS icp_results (
     buying_probability_score FLOAT,
     icp_match                VARCHAR(50),
     notes                    TEXT,
-    created_at               TIMESTAMP NOT NULL DEFAULT NOW()
+    created_at               TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 CREATE INDEX IF NOT EXISTS ix_icp_results_contact_id ON icp_results (contact_id);
 
 CREATE TABLE IF NOT EXISTS pipeline_runs (
     id                     UUID        PRIMARY KEY DEFAULT gen_random_uuid(),
     campaign_id            UUID        NOT NULL REFERENCES campaigns (id),
-    state                  VARCHAR(50) NOT NULL DEFAULT 'CREATED',
-    classification_summary JSON,
-    downstream_results     JSON,
-    started_at             TIMESTAMP   NOT NULL DEFAULT NOW(),
-    completed_at           TIMESTAMP,
+    state                  pipeline_state_enum NOT NULL DEFAULT 'CREATED',
+    classification_summary JSONB,
+    downstream_results     JSONB,
+    started_at             TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    completed_at           TIMESTAMPTZ,
     error_message          TEXT
 );
 CREATE INDEX IF NOT EXISTS ix_pipeline_runs_campaign_id ON pipeline_runs (campaign_id);
@@ -77,12 +77,12 @@ CREATE TABLE IF NOT EXISTS campaign_logs (
     id            UUID         PRIMARY KEY DEFAULT gen_random_uuid(),
     campaign_id   UUID         NOT NULL REFERENCES campaigns (id),
     agent_name    VARCHAR(100) NOT NULL,
-    started_at    TIMESTAMP    NOT NULL DEFAULT NOW(),
-    completed_at  TIMESTAMP,
+    started_at    TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+    completed_at  TIMESTAMPTZ,
     duration_ms   INTEGER,
     status        VARCHAR(50)  NOT NULL DEFAULT 'RUNNING',
     error_message TEXT,
-    metadata      JSON
+    metadata      JSONB
 );
 CREATE INDEX IF NOT EXISTS ix_campaign_logs_campaign_id ON campaign_logs (campaign_id);
 
@@ -91,13 +91,14 @@ CREATE TABLE IF NOT EXISTS outbound_messages (
     campaign_id         UUID         NOT NULL REFERENCES campaigns (id),
     contact_email       VARCHAR(255) NOT NULL,
     channel             VARCHAR(50)  NOT NULL,
-    message_payload     TEXT,
+    message_payload     JSONB,
     send_status         VARCHAR(50)  DEFAULT 'PENDING',
     provider_message_id VARCHAR(255),
-    sent_at             TIMESTAMP,
-    created_at          TIMESTAMP    NOT NULL DEFAULT NOW()
+    sent_at             TIMESTAMPTZ,
+    created_at          TIMESTAMPTZ  NOT NULL DEFAULT NOW()
 );
-CREATE INDEX IF NOT EXISTS ix_outbound_messages_campaign_id     ON outbound_messages (campaign_id);
+CREATE INDEX IF NOT EXISTS ix_outbound_messages_campaign_channel ON outbound_messages (campaign_id, channel);
+CREATE INDEX IF NOT EXISTS ix_outbound_messages_campaign_contact ON outbound_messages (campaign_id, contact_email);
 CREATE INDEX IF NOT EXISTS ix_outbound_messages_contact_email   ON outbound_messages (contact_email);
 CREATE INDEX IF NOT EXISTS ix_outbound_messages_provider_msg_id ON outbound_messages (provider_message_id);
 
@@ -108,11 +109,12 @@ CREATE TABLE IF NOT EXISTS email_tracking_events (
     event_type    VARCHAR(50)  NOT NULL,
     message_id    VARCHAR(255),
     event_at      BIGINT,
-    raw_payload   JSON,
-    created_at    TIMESTAMP    NOT NULL DEFAULT NOW()
+    raw_payload   JSONB,
+    created_at    TIMESTAMPTZ  NOT NULL DEFAULT NOW()
 );
-CREATE INDEX IF NOT EXISTS ix_email_tracking_events_campaign_id   ON email_tracking_events (campaign_id);
+CREATE INDEX IF NOT EXISTS ix_email_tracking_events_campaign_event ON email_tracking_events (campaign_id, event_type);
 CREATE INDEX IF NOT EXISTS ix_email_tracking_events_contact_email ON email_tracking_events (contact_email);
+CREATE INDEX IF NOT EXISTS ix_email_tracking_events_raw_payload   ON email_tracking_events USING GIN (raw_payload);
 
 CREATE TABLE IF NOT EXISTS engagement_history (
     id            UUID         PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -120,10 +122,12 @@ CREATE TABLE IF NOT EXISTS engagement_history (
     contact_email VARCHAR(255) NOT NULL,
     channel       VARCHAR(50)  NOT NULL,
     event_type    VARCHAR(50)  NOT NULL,
-    payload       JSON,
-    occurred_at   TIMESTAMP    NOT NULL DEFAULT NOW()
+    payload       JSONB,
+    occurred_at   TIMESTAMPTZ  NOT NULL DEFAULT NOW()
 );
-CREATE INDEX IF NOT EXISTS ix_engagement_history_campaign_id   ON engagement_history (campaign_id);
+CREATE INDEX IF NOT EXISTS ix_engagement_history_campaign_event   ON engagement_history (campaign_id, event_type);
+CREATE INDEX IF NOT EXISTS ix_engagement_history_campaign_time    ON engagement_history (campaign_id, occurred_at);
+CREATE INDEX IF NOT EXISTS ix_engagement_history_campaign_contact ON engagement_history (campaign_id, contact_email);
 CREATE INDEX IF NOT EXISTS ix_engagement_history_contact_email ON engagement_history (contact_email);
 
 CREATE TABLE IF NOT EXISTS conversion_events (
@@ -132,10 +136,10 @@ CREATE TABLE IF NOT EXISTS conversion_events (
     contact_email VARCHAR(255) NOT NULL,
     event_type    VARCHAR(100) NOT NULL,
     value         FLOAT,
-    metadata      JSON,
-    occurred_at   TIMESTAMP    NOT NULL DEFAULT NOW()
+    metadata      JSONB,
+    occurred_at   TIMESTAMPTZ  NOT NULL DEFAULT NOW()
 );
-CREATE INDEX IF NOT EXISTS ix_conversion_events_campaign_id   ON conversion_events (campaign_id);
+CREATE INDEX IF NOT EXISTS ix_conversion_events_campaign_contact ON conversion_events (campaign_id, contact_email);
 CREATE INDEX IF NOT EXISTS ix_conversion_events_contact_email ON conversion_events (contact_email);
 
 -- ── Voice Calls ──────────────────────────────────────────────────────────────
@@ -148,8 +152,16 @@ CREATE TABLE IF NOT EXISTS voice_calls (
     call_sid          VARCHAR(100) UNIQUE,
     status            VARCHAR(50)  NOT NULL DEFAULT 'initiated',
     conversation_log  JSONB,
-    created_at        TIMESTAMP    NOT NULL DEFAULT NOW(),
-    updated_at        TIMESTAMP    NOT NULL DEFAULT NOW()
+    conversation_state JSONB,
+    turn_count        INTEGER      DEFAULT 0,
+    language_code     VARCHAR(10)  DEFAULT 'en-US',
+    email_captured    VARCHAR(255),
+    email_sent        INTEGER      DEFAULT 0,
+    retry_count       INTEGER      DEFAULT 0,
+    duration_seconds  INTEGER      DEFAULT 0,
+    quality_score     INTEGER,
+    created_at        TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+    updated_at        TIMESTAMPTZ  NOT NULL DEFAULT NOW()
 );
 CREATE INDEX IF NOT EXISTS ix_voice_calls_campaign_id    ON voice_calls (campaign_id);
 CREATE INDEX IF NOT EXISTS ix_voice_calls_contact_email  ON voice_calls (contact_email);
@@ -1,7 +1,7 @@
 import random
 import psycopg2
 from faker import Faker
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 # -------------------------
 # CONFIGURATION
@@ -74,7 +74,7 @@ def generate_contact():
     callanswerrate = maybe_null(random.choice(CALL_ANSWER_RATE))
     preferredtime = maybe_null(random.choice(PREFERRED_TIMES))
     phone = maybe_null(fake.phone_number(), probability=0.3)  # ~70% of contacts have a phone
-    created_at = datetime.now() - timedelta(days=random.randint(0, 365))
+    created_at = datetime.now(timezone.utc) - timedelta(days=random.randint(0, 365))
     updated_at = created_at + timedelta(days=random.randint(0, 30))
     return (
         email,